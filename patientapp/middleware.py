@@ -47,7 +47,7 @@ class PatientLanguageMiddleware:
                         # update the session to remember their choice
                         if user_chosen_language and user_chosen_language != preferred_language:
                             request.session[LANGUAGE_SESSION_KEY] = user_chosen_language
-                            logger.info(f"Patient {patient.name} manually chose language {user_chosen_language}")
+                            logger.info("Patient %s manually chose language %s", patient.name, user_chosen_language)
                         
                         # Only auto-switch if:
                         # 1. Current language doesn't match preferred language
@@ -66,7 +66,7 @@ class PatientLanguageMiddleware:
                             # Set the language in the session for persistence
                             request.session[LANGUAGE_SESSION_KEY] = preferred_language
                             
-                            logger.info(f"Language auto-switched to {preferred_language} for patient {patient.name} (ID: {patient.id})")
+                            logger.info("Language auto-switched to %s for patient %s (ID: %s)", preferred_language, patient.name, patient.id)
                             
                             # Skip redirects for special paths that shouldn't be language-prefixed
                             skip_paths = ['/i18n/', '/media/', '/static/', '/__debug__/', '/admin/']
@@ -92,7 +92,7 @@ class PatientLanguageMiddleware:
                                         if query_string:
                                             new_path = f'{new_path}?{query_string}'
                                         
-                                        logger.info(f"Redirecting from {current_path} to {new_path}")
+                                        logger.info("Redirecting from %s to %s", current_path, new_path)
                                         return redirect(new_path)
                                 
                                 # If no language prefix found, check if we're on a non-prefixed URL
@@ -102,7 +102,7 @@ class PatientLanguageMiddleware:
                                     query_string = request.META.get('QUERY_STRING', '')
                                     if query_string:
                                         new_path = f'{new_path}?{query_string}'
-                                    logger.info(f"Redirecting from {current_path} to {new_path}")
+                                    logger.info("Redirecting from %s to %s", current_path, new_path)
                                     return redirect(new_path)
                         
             except Patient.DoesNotExist:
@@ -110,7 +110,7 @@ class PatientLanguageMiddleware:
                 pass
             except Exception as e:
                 # Log any unexpected errors but don't break the request
-                logger.error(f"Error in PatientLanguageMiddleware: {e}", exc_info=True)
+                logger.error("Error in PatientLanguageMiddleware: %s", e, exc_info=True)
         
         response = self.get_response(request)
         return response
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.8 on 2026-10-17 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('promapp', '0023_alter_itemtranslation_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='likertscale',
+            index=models.Index(fields=['-created_date'], name='likert_created_desc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rangescale',
+            index=models.Index(fields=['-created_date'], name='range_created_desc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='questionnaire',
+            index=models.Index(fields=['questionnaire_order'], name='questionnaire_order_idx'),
+        ),
+    ]
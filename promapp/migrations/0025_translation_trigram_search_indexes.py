@@ -0,0 +1,43 @@
+from django.db import migrations
+
+
+# Translation columns searched with __icontains by the translation list views.
+# On PostgreSQL, icontains compiles to UPPER("column"::text) LIKE UPPER(%s), so the
+# trigram indexes are built on that expression to be usable for substring search.
+TRIGRAM_INDEXES = [
+    ('promapp_item_translation_name_trgm', 'promapp_item_translation', 'name'),
+    ('promapp_questionnaire_translation_name_trgm', 'promapp_questionnaire_translation', 'name'),
+    ('promapp_likertoption_translation_text_trgm', 'promapp_likertscaleresponseoption_translation', 'option_text'),
+    ('promapp_rangescale_translation_min_trgm', 'promapp_rangescale_translation', 'min_value_text'),
+    ('promapp_rangescale_translation_max_trgm', 'promapp_rangescale_translation', 'max_value_text'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # Trigram indexes are PostgreSQL only; other backends keep the plain LIKE scan
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for index_name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{index_name}" ON "{table}" '
+            f'USING gin (UPPER("{column}"::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('promapp', '0024_likertscale_likert_created_desc_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
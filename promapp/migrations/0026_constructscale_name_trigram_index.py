@@ -0,0 +1,34 @@
+from django.db import migrations
+
+
+# search_construct_scales filters ConstructScale.name with __icontains. On PostgreSQL this
+# compiles to UPPER("name"::text) LIKE UPPER(%s), so the trigram index is built on that
+# expression, as in 0025.
+INDEX_NAME = 'promapp_constructscale_name_trgm'
+
+
+def create_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS "{INDEX_NAME}" ON "promapp_constructscale" '
+        f'USING gin (UPPER("name"::text) gin_trgm_ops)'
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS "{INDEX_NAME}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('promapp', '0025_translation_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
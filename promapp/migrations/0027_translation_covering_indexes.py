@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+# The translation list views sort by the default-language name, read with a correlated
+# subquery on (master_id, language_code). Parler's unique constraint already finds the row;
+# including the name column lets PostgreSQL answer the subquery from the index alone.
+COVERING_INDEXES = [
+    ('promapp_questionnaire_tr_master_lang_cover', 'promapp_questionnaire_translation', 'name'),
+    ('promapp_likertoption_tr_master_lang_cover', 'promapp_likertscaleresponseoption_translation', 'option_text'),
+    ('promapp_rangescale_tr_master_lang_cover', 'promapp_rangescale_translation', 'min_value_text'),
+]
+
+
+def create_covering_indexes(apps, schema_editor):
+    # INCLUDE columns are PostgreSQL only; other backends keep using the unique constraint
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, table, column in COVERING_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{index_name}" ON "{table}" '
+            f'("master_id", "language_code") INCLUDE ("{column}")'
+        )
+
+
+def drop_covering_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, table, column in COVERING_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('promapp', '0026_constructscale_name_trigram_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_covering_indexes, drop_covering_indexes),
+    ]
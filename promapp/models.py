@@ -7,7 +7,8 @@ from patientapp.models import Patient,Diagnosis,Treatment
 from django.contrib.auth.models import User
 from parler.models import TranslatableModel, TranslatedFields
 from django.db.models import Q
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import pre_save, post_save, post_delete, m2m_changed
+from django.core.cache import cache
 from django.dispatch import receiver
 from django.utils.safestring import mark_safe
 import re
@@ -84,13 +85,17 @@ class ConstructScale(models.Model):
     def __str__(self):
         return self.name
     
-    def get_valid_items_with_numbers(self):
+    def get_valid_items_with_numbers(self, items=None):
         """
         Returns a list of valid items (Number, Likert, or Range) with their stored item numbers.
+        items can be an already loaded or restricted collection of this scale's items; by
+        default all of them are read.
         """
+        if items is None:
+            items = self.item_set.all()
         valid_items = []
         
-        for item in self.item_set.all():
+        for item in items:
             if item.response_type in ['Number', 'Likert', 'Range']:
                 valid_items.append({
                     'item': item,
@@ -206,10 +211,27 @@ class LikertScale(models.Model):
         ordering = ['-created_date']
         verbose_name = 'Likert Scale'
         verbose_name_plural = 'Likert Scales'
+        indexes = [
+            models.Index(fields=['-created_date'], name='likert_created_desc_idx'),
+        ]
 
     def __str__(self):
         return self.likert_scale_name
 
+    def get_option_values(self):
+        """
+        Return the option values of this scale as a frozenset.
+        The result is cached per scale and cleared whenever one of its options changes.
+        """
+        cache_key = f'likert-vals:{self.pk}'
+        option_values = cache.get(cache_key)
+        if option_values is None:
+            option_values = frozenset(
+                self.likertscaleresponseoption_set.values_list('option_value', flat=True)
+            )
+            cache.set(cache_key, option_values, 300)
+        return option_values
+
     def get_viridis_colors(self, n_colors):
         """
         Generate n colors from the viridis color palette.
@@ -412,6 +434,9 @@ class RangeScale(TranslatableModel):
         ordering = ['-created_date']
         verbose_name = 'Range Scale'
         verbose_name_plural = 'Range Scales'
+        indexes = [
+            models.Index(fields=['-created_date'], name='range_created_desc_idx'),
+        ]
 
 
     def validate_increment(self):
@@ -779,6 +804,9 @@ class Questionnaire(TranslatableModel):
         ordering = ['-created_date']
         verbose_name = 'Questionnaire'
         verbose_name_plural = 'Questionnaires'
+        indexes = [
+            models.Index(fields=['questionnaire_order'], name='questionnaire_order_idx'),
+        ]
     def __str__(self):
         # Use Parler's safe_translation_getter to get the translated name
         questionnaire_name = self.safe_translation_getter('name', any_language=True) if hasattr(self, 'safe_translation_getter') else None
@@ -1016,6 +1044,54 @@ class QuestionnaireItemRuleGroup(models.Model):
     def __str__(self):
         return f"Rule group for {self.questionnaire_item}"
 
+@receiver([post_save, post_delete], sender=LikertScaleResponseOption)
+def invalidate_likert_option_values(sender, instance, **kwargs):
+    """Clear the cached option values of the Likert scale the option belongs to."""
+    cache.delete(f'likert-vals:{instance.likert_scale_id}')
+
+# Cache version used to key the fragment-cached scale list tables. Any change to a
+# scale, its options or its translations rotates the version so stale fragments are skipped.
+SCALE_LIST_CACHE_VERSION_KEY = 'scale_list_cache_version'
+
+def get_scale_list_cache_version():
+    """Return the current cache version for the scale list table fragments."""
+    return cache.get_or_set(SCALE_LIST_CACHE_VERSION_KEY, lambda: uuid.uuid4().hex, None)
+
+def invalidate_scale_list_cache(sender, **kwargs):
+    """Rotate the scale list cache version so cached table fragments are no longer used."""
+    cache.set(SCALE_LIST_CACHE_VERSION_KEY, uuid.uuid4().hex, None)
+
+for _scale_list_model in (
+    LikertScale,
+    LikertScaleResponseOption,
+    LikertScaleResponseOption._parler_meta.root_model,
+    RangeScale,
+    RangeScale._parler_meta.root_model,
+    ConstructScale,
+    Item,
+):
+    post_save.connect(invalidate_scale_list_cache, sender=_scale_list_model)
+    post_delete.connect(invalidate_scale_list_cache, sender=_scale_list_model)
+
+# Adding or removing items from a construct scale changes its item count in the list
+m2m_changed.connect(invalidate_scale_list_cache, sender=Item.construct_scale.through)
+
+# Cache version used to key the cached patient questionnaire list counts. Adding or
+# removing patients or questionnaire assignments rotates it so stale totals are skipped.
+PATIENT_QUESTIONNAIRE_LIST_CACHE_VERSION_KEY = 'patient_questionnaire_list_cache_version'
+
+def get_patient_questionnaire_list_cache_version():
+    """Return the current cache version for the patient questionnaire list counts."""
+    return cache.get_or_set(PATIENT_QUESTIONNAIRE_LIST_CACHE_VERSION_KEY, lambda: uuid.uuid4().hex, None)
+
+def invalidate_patient_questionnaire_list_cache(sender, **kwargs):
+    """Rotate the patient questionnaire list cache version so cached counts are no longer used."""
+    cache.set(PATIENT_QUESTIONNAIRE_LIST_CACHE_VERSION_KEY, uuid.uuid4().hex, None)
+
+for _patient_list_model in (Patient, PatientQuestionnaire):
+    post_save.connect(invalidate_patient_questionnaire_list_cache, sender=_patient_list_model)
+    post_delete.connect(invalidate_patient_questionnaire_list_cache, sender=_patient_list_model)
+
 # Add signal to handle question number changes
 @receiver(pre_save, sender=QuestionnaireItem)
 def validate_question_number_change(sender, instance, **kwargs):
@@ -1,11 +1,6 @@
 #!/usr/bin/env python3
-import os
-import django
-
-# Setup Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'chaviprom.settings')
-django.setup()
-
+# The equation parser only needs Lark and Django's ValidationError, neither of which
+# requires configured settings, so the app registry is not loaded here.
 from promapp.equation_parser import EquationTransformer
 from lark import Lark
 
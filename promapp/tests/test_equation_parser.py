@@ -1,16 +1,19 @@
-from django.test import TestCase
+from django.test import SimpleTestCase
 from django.core.exceptions import ValidationError
 from promapp.equation_parser import EquationValidator, EquationTransformer
-from lark import Lark, UnexpectedToken
+from lark import Lark
 
-class EquationParserTest(TestCase):
-    def setUp(self):
-        # Load the grammar
+class EquationParserTest(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Load the grammar and build the LALR tables once; the parsers are stateless between parses
         with open('promapp/equation_validation_rules.lark', 'r') as f:
-            self.grammar = f.read()
-        self.parser = Lark(self.grammar, parser='lalr')
-        self.validator = EquationValidator()
-        
+            cls.grammar = f.read()
+        cls.parser = Lark(cls.grammar, parser='lalr')
+        cls.validator = EquationValidator()
+
+    def setUp(self):
         # Sample question values for testing
         self.question_values = {
             1: 10,  # q1 = 10
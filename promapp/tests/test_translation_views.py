@@ -0,0 +1,35 @@
+from django.contrib.auth import get_user_model
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import translation
+from promapp.models import Questionnaire
+from promapp.views import QuestionnaireTranslationView
+
+@override_settings(LANGUAGE_CODE='en-gb')
+class QuestionnaireTranslationViewTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_superuser('translator', 'translator@example.com', 'password')
+        self.questionnaire = Questionnaire()
+        self.questionnaire.set_current_language('en-gb')
+        self.questionnaire.name = 'Q1'
+        self.questionnaire.description = 'First questionnaire'
+        self.questionnaire.save()
+
+    def post_translation(self, language, data):
+        request = RequestFactory().post(f'/?language={language}', data)
+        request.user = self.user
+        request._messages = CookieStorage(request)
+        with translation.override('en-gb'):
+            return QuestionnaireTranslationView.as_view()(request, pk=self.questionnaire.pk)
+
+    def test_saving_translation_leaves_other_languages_unchanged(self):
+        """Posting a Hindi translation must not overwrite the default-language row"""
+        response = self.post_translation('hi', {'name': 'NEW HI', 'description': 'Hindi description'})
+
+        self.assertEqual(response.status_code, 302)
+        translations = dict(
+            Questionnaire._parler_meta.root_model.objects.filter(
+                master=self.questionnaire
+            ).values_list('language_code', 'name')
+        )
+        self.assertEqual(translations, {'en-gb': 'Q1', 'hi': 'NEW HI'})
@@ -4,6 +4,7 @@ from django.views.generic import ListView, CreateView, UpdateView, DetailView, D
 from django.urls import reverse_lazy, reverse
 from django.http import HttpResponse, JsonResponse
 from django.template.loader import render_to_string
+from django.template.response import TemplateResponse
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin, PermissionRequiredMixin
 from django.contrib import messages
 from django.db import transaction
@@ -13,7 +14,7 @@ from django.conf import settings
 from django.utils import translation
 from django.utils.html import escape
 from django.utils.http import url_has_allowed_host_and_scheme
-from .models import Questionnaire, Item, QuestionnaireItem, LikertScale, RangeScale, ConstructScale, ResponseTypeChoices, LikertScaleResponseOption, PatientQuestionnaire, QuestionnaireItemResponse, Patient, QuestionnaireItemRule, QuestionnaireItemRuleGroup, QuestionnaireSubmission, QuestionnaireConstructScore, CompositeConstructScaleScoring
+from .models import Questionnaire, Item, QuestionnaireItem, LikertScale, RangeScale, ConstructScale, ResponseTypeChoices, LikertScaleResponseOption, PatientQuestionnaire, QuestionnaireItemResponse, Patient, QuestionnaireItemRule, QuestionnaireItemRuleGroup, QuestionnaireSubmission, QuestionnaireConstructScore, CompositeConstructScaleScoring, get_scale_list_cache_version, get_patient_questionnaire_list_cache_version
 from .forms import (
     QuestionnaireForm, ItemForm, QuestionnaireItemForm, 
     LikertScaleForm, LikertScaleResponseOptionFormSet,
@@ -26,19 +27,80 @@ from .forms import (
 from django.utils.translation import get_language
 from django.db import models
 from django.core.exceptions import ValidationError
-from django.db.models import Prefetch, Q
+from django.db.models import Prefetch, Q, F, Value, OuterRef, Subquery, Exists, ExpressionWrapper
+from django.db.models.functions import Greatest
+from django.core.paginator import Paginator
+from django.core.cache import cache
+from django.utils.functional import cached_property, SimpleLazyObject
+from django.views.decorators.cache import cache_control, cache_page
+from django.views.decorators.http import etag
+import functools
+import hashlib
 import json
 import logging
+import operator
+import re
 import csv
 from datetime import datetime
 from django.utils.timesince import timeuntil
 from django.conf import settings
 from django.utils import translation
 import uuid
+from collections import defaultdict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from patientapp.models import Patient
+from parler import appsettings as parler_appsettings
+
+logger = logging.getLogger(__name__)
+
+# Language codes accepted by switch_language
+_VALID_LANGUAGE_CODES = frozenset(code for code, name in settings.LANGUAGES)
+
+# orjson is optional; when it is installed the AJAX endpoints use it for the request and response bodies
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _load_json_body(request):
+    """Parse the JSON request body. Raises json.JSONDecodeError (which orjson's error subclasses) on bad input."""
+    if orjson is not None:
+        return orjson.loads(request.body)
+    return json.loads(request.body)
+
+def _json_response(data):
+    """JsonResponse equivalent for the hot AJAX success paths."""
+    if orjson is not None:
+        return HttpResponse(orjson.dumps(data), content_type='application/json')
+    return JsonResponse(data)
 
 # Create your views here.
 
+class CachedCountPaginator(Paginator):
+    '''
+    Paginator that stores the total object count in the cache so that paging
+    through a filtered list does not re-run the COUNT query on every page.
+    '''
+    def __init__(self, *args, count_cache_key=None, count_cache_timeout=60, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_cache_key = count_cache_key
+        self.count_cache_timeout = count_cache_timeout
+
+    @cached_property
+    def count(self):
+        if not self.count_cache_key:
+            return super().count
+        count = cache.get(self.count_cache_key)
+        if count is None:
+            # Ordering has no effect on the count, drop it so the database can skip the sort
+            object_list = self.object_list
+            if hasattr(object_list, 'order_by'):
+                count = object_list.order_by().count()
+            else:
+                count = len(object_list)
+            cache.set(self.count_cache_key, count, self.count_cache_timeout)
+        return count
+
 class QuestionnaireListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
     '''
     Questionnaire List View for displaying list of avaialble questionnaires.
@@ -51,20 +113,30 @@ class QuestionnaireListView(LoginRequiredMixin, PermissionRequiredMixin, ListVie
     paginate_by = 10  # Show 10 questionnaires per page
 
     def get_queryset(self):
-        queryset = super().get_queryset()
+        # Filters on translations and items use EXISTS subqueries, and the sort name is a
+        # scalar subquery, so no join is made that would need DISTINCT to remove duplicates
+        questionnaire_translations = Questionnaire._parler_meta.root_model.objects.filter(master=OuterRef('pk'))
+        queryset = super().get_queryset().annotate(
+            display_name=Subquery(
+                questionnaire_translations.filter(language_code=settings.LANGUAGE_CODE).values('name')[:1]
+            )
+        )
         
         # Apply search filter if provided
         search = self.request.GET.get('search')
         if search:
-            queryset = queryset.filter(translations__name__icontains=search)
+            queryset = queryset.filter(
+                Exists(questionnaire_translations.filter(name__icontains=search))
+            )
         
         # Apply has items filter if provided
         has_items = self.request.GET.get('has_items')
         if has_items and has_items != 'all':
+            questionnaire_items = QuestionnaireItem.objects.filter(questionnaire=OuterRef('pk'))
             if has_items == 'yes':
-                queryset = queryset.filter(questionnaireitem__isnull=False)
+                queryset = queryset.filter(Exists(questionnaire_items))
             elif has_items == 'no':
-                queryset = queryset.filter(questionnaireitem__isnull=True)
+                queryset = queryset.exclude(Exists(questionnaire_items))
         
         # Apply answer interval filter if provided
         answer_interval = self.request.GET.get('answer_interval')
@@ -74,12 +146,12 @@ class QuestionnaireListView(LoginRequiredMixin, PermissionRequiredMixin, ListVie
             elif answer_interval == 'has_interval':
                 queryset = queryset.filter(questionnaire_answer_interval__gt=0)
             
-        return queryset.distinct('id').order_by('id', 'translations__name')
+        return queryset.order_by('display_name', 'id').prefetch_related('translations')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['search_query'] = self.request.GET.get('search', '')
-        context['is_htmx'] = bool(self.request.META.get('HTTP_HX_REQUEST'))
+        context['is_htmx'] = bool(self.request.htmx)
         
         # Create filters for the search component
         context['questionnaire_filters'] = [
@@ -111,23 +183,21 @@ class QuestionnaireListView(LoginRequiredMixin, PermissionRequiredMixin, ListVie
         questionnaires_with_translation_status = []
         for questionnaire in context['questionnaires']:
             # Get all existing translations for this questionnaire
-            existing_translations = set(
-                questionnaire.translations.values_list('language_code', flat=True)
-            )
+            existing_translations = {
+                questionnaire_translation.language_code: questionnaire_translation
+                for questionnaire_translation in questionnaire.translations.all()
+            }
             
             translation_status = []
             for lang_code, lang_name in settings.LANGUAGES:
                 has_translation = lang_code in existing_translations
                 # Check if translation has content (not just empty strings)
                 if has_translation:
-                    try:
-                        translation = questionnaire.translations.get(language_code=lang_code)
-                        has_content = bool(
-                            (translation.name and translation.name.strip()) or 
-                            (translation.description and translation.description.strip())
-                        )
-                    except questionnaire.translations.model.DoesNotExist:
-                        has_content = False
+                    translation = existing_translations[lang_code]
+                    has_content = bool(
+                        (translation.name and translation.name.strip()) or 
+                        (translation.description and translation.description.strip())
+                    )
                 else:
                     has_content = False
                     
@@ -147,7 +217,7 @@ class QuestionnaireListView(LoginRequiredMixin, PermissionRequiredMixin, ListVie
 
     def get(self, request, *args, **kwargs):
         # Check if this is an HTMX request
-        if request.META.get('HTTP_HX_REQUEST'):
+        if request.htmx:
             # For HTMX requests, let Django handle pagination normally
             # but just return the partial template
             response = super().get(request, *args, **kwargs)
@@ -534,13 +604,13 @@ class ItemListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
         context['current_language'] = get_language()
         
         # Flag to determine if we're responding to an HTMX request
-        context['is_htmx'] = bool(self.request.META.get('HTTP_HX_REQUEST'))
+        context['is_htmx'] = bool(self.request.htmx)
         
         return context
     
     def get(self, request, *args, **kwargs):
         # Check if this is an HTMX request
-        if request.META.get('HTTP_HX_REQUEST'):
+        if request.htmx:
             # For HTMX requests, let Django handle pagination normally
             # but just return the partial template
             response = super().get(request, *args, **kwargs)
@@ -711,17 +781,17 @@ def create_likert_scale(request):
     
     if edit_id:
         instance = get_object_or_404(LikertScale, pk=edit_id)
-        print(f"Editing likert scale: {instance.likert_scale_name} (ID: {instance.id})")
+        logger.debug("Editing likert scale: %s (ID: %s)", instance.likert_scale_name, instance.id)
     
     if request.method == 'POST':
-        # Collect and debug POST data
-        print("POST data:", request.POST)
-        
         # Get the standard formset prefix
         prefix = 'likertscaleresponseoption_set'
-        print(f"Standard formset prefix: {prefix}")
-        print(f"TOTAL_FORMS: {request.POST.get(f'{prefix}-TOTAL_FORMS')}")
-        print(f"INITIAL_FORMS: {request.POST.get(f'{prefix}-INITIAL_FORMS')}")
+        logger.debug(
+            "Formset prefix %s: TOTAL_FORMS=%s, INITIAL_FORMS=%s",
+            prefix,
+            request.POST.get(f'{prefix}-TOTAL_FORMS'),
+            request.POST.get(f'{prefix}-INITIAL_FORMS')
+        )
         
         # Process the form for the likert scale itself
         form = LikertScaleForm(request.POST, instance=instance)
@@ -732,14 +802,7 @@ def create_likert_scale(request):
         else:
             formset = LikertScaleResponseOptionFormSet(request.POST, request.FILES)
         
-        # Debug formset
-        print(f"Formset has {len(formset.forms)} forms")
-        for i, form_instance in enumerate(formset.forms):
-            print(f"Formset form {i} data:", {
-                'option_order': form_instance['option_order'].value(),
-                'option_value': form_instance['option_value'].value(),
-                'option_text': form_instance['option_text'].value(),
-            })
+        logger.debug("Formset has %d forms", len(formset.forms))
         
         # Check form validity first
         valid_form = form.is_valid()
@@ -759,7 +822,7 @@ def create_likert_scale(request):
                 if len(parts) == 3 and parts[1].isdigit():  # form-X-field format
                     form_indices.add(parts[1])
         
-        print(f"Found {len(form_indices)} unique form indices: {', '.join(form_indices)}")
+        logger.debug("Found %d unique form indices: %s", len(form_indices), form_indices)
         
         # For each form index, extract all fields
         for form_index in form_indices:
@@ -780,15 +843,13 @@ def create_likert_scale(request):
                     'likert_scale_id': likert_scale_id.strip()
                 })
         
-        print(f"Found {len(dynamic_forms)} dynamically added form entries")
-        for i, dform in enumerate(dynamic_forms):
-            print(f"Dynamic form {i+1} data:", dform)
+        logger.debug("Found %d dynamically added form entries", len(dynamic_forms))
         
         if valid_form and valid_formset:
             with transaction.atomic():
                 # First save the likert scale
                 likert_scale = form.save()
-                print(f"Saved likert scale: {likert_scale.likert_scale_name} (ID: {likert_scale.id})")
+                logger.debug("Saved likert scale: %s (ID: %s)", likert_scale.likert_scale_name, likert_scale.id)
                 
                 # Save the standard formset (skip empty forms)
                 formset.instance = likert_scale
@@ -802,8 +863,10 @@ def create_likert_scale(request):
                         option_value = form_instance.cleaned_data.get('option_value')
                         delete_flag = form_instance.cleaned_data.get('DELETE', False)
                         
-                        # Debug
-                        print(f"Processing form with data: order={option_order}, value={option_value}, text={option_text}, delete={delete_flag}")
+                        logger.debug(
+                            "Processing form with data: order=%s, value=%s, text=%s, delete=%s",
+                            option_order, option_value, option_text, delete_flag
+                        )
                         
                         if not delete_flag and (option_order is not None or option_text):
                             try:
@@ -829,30 +892,25 @@ def create_likert_scale(request):
                                     # Save and track
                                     option.save()
                                     saved_options.append(option)
-                                    print(f"Saved option: {option.option_text} (order: {option.option_order}, value: {option.option_value})")
+                                    logger.debug("Saved option: %s (order: %s, value: %s)", option.option_text, option.option_order, option.option_value)
                                 except Exception as e:
                                     if 'unique constraint' in str(e).lower():
                                         error_msg = f"Cannot save option: A response option with order {option.option_order} and value {option.option_value} already exists in this scale."
-                                        print(error_msg)
                                         messages.error(request, error_msg)
                                     else:
-                                        print(f"Error saving option: {e}")
-                                        logger = logging.getLogger("promapp.likert_scale_management")
-                                        logger.error(f"Unexpected error saving likert option: {str(e)}")
+                                        logger.error("Unexpected error saving likert option: %s", e)
                                         messages.error(request, "Error saving option. Please check your input and try again.")
                             except Exception as e:
-                                print(f"Error processing option: {e}")
-                                logger = logging.getLogger("promapp.likert_scale_management")
-                                logger.error(f"Unexpected error processing likert option: {str(e)}")
+                                logger.error("Unexpected error processing likert option: %s", e)
                                 messages.error(request, "Error processing option. Please check your input and try again.")
                         elif delete_flag and form_instance.instance.pk:
                             # Delete if marked and exists
                             form_instance.instance.delete()
-                            print(f"Deleted option with ID: {form_instance.instance.pk}")
+                            logger.debug("Deleted option with ID: %s", form_instance.instance.pk)
                     else:
-                        print(f"Form validation failed: {form_instance.errors}")
+                        logger.debug("Form validation failed: %s", form_instance.errors)
                 
-                print(f"Saved {len(saved_options)} options from formset")
+                logger.debug("Saved %d options from formset", len(saved_options))
                 
                 # Process and save dynamically added forms manually
                 for dform in dynamic_forms:
@@ -883,21 +941,16 @@ def create_likert_scale(request):
                         # Check for duplicates before saving
                         try:
                             option.save()
-                            print(f"Saved dynamic option: {option.option_text} (order: {option.option_order}, value: {option.option_value})")
+                            logger.debug("Saved dynamic option: %s (order: %s, value: %s)", option.option_text, option.option_order, option.option_value)
                         except Exception as e:
                             if 'unique constraint' in str(e).lower():
                                 error_msg = f"Cannot save dynamic option: A response option with order {option.option_order} and value {option.option_value} already exists in this scale."
-                                print(error_msg)
                                 messages.error(request, error_msg)
                             else:
-                                print(f"Error saving dynamic option: {e}")
-                                logger = logging.getLogger("promapp.likert_scale_management")
-                                logger.error(f"Unexpected error saving dynamic likert option: {str(e)}")
+                                logger.error("Unexpected error saving dynamic likert option: %s", e)
                                 messages.error(request, "Error saving dynamic option. Please check your input and try again.")
                     except Exception as e:
-                        print(f"Error processing dynamic option: {e}")
-                        logger = logging.getLogger("promapp.likert_scale_management")
-                        logger.error(f"Unexpected error processing dynamic likert option: {str(e)}")
+                        logger.error("Unexpected error processing dynamic likert option: %s", e)
                         messages.error(request, "Error processing dynamic option. Please check your input and try again.")
                 
                 if instance:
@@ -912,14 +965,10 @@ def create_likert_scale(request):
                     return redirect('item_create')
         else:
             if not valid_form:
-                print("Form errors:", form.errors)
+                logger.debug("Form errors: %s", form.errors)
                 messages.error(request, "Please check the scale details for errors.")
             if not valid_formset:
-                print("Formset errors:", formset.errors)
-                print("Formset non-form errors:", formset.non_form_errors())
-                for i, form_errors in enumerate(formset.errors):
-                    if form_errors:
-                        print(f"Form {i} errors:", form_errors)
+                logger.debug("Formset errors: %s, non-form errors: %s", formset.errors, formset.non_form_errors())
                 messages.error(request, "Please check the response options for errors.")
     else:
         # Initialize form and formset with instance data if editing
@@ -968,10 +1017,6 @@ def create_construct_scale(request):
 
 def add_likert_option(request):
     """Add a new empty row to the Likert scale formset."""
-    # Extract all parameters from the request for debugging
-    params = {key: request.GET.get(key) for key in request.GET}
-    print(f"Add option request parameters: {params}")
-    
     # Get the form index (default to a safe value if missing)
     form_index = int(request.GET.get('form_index', 0))
     
@@ -997,23 +1042,24 @@ def add_likert_option(request):
     
     if scale_id:
         try:
-            scale = LikertScale.objects.get(pk=scale_id)
-            print(f"Found likert scale: {scale.likert_scale_name} (ID: {scale.id})")
+            scale = LikertScale.objects.only('id', 'likert_scale_name').get(pk=scale_id)
+            logger.debug("Found likert scale: %s (ID: %s)", scale.likert_scale_name, scale.id)
             
             # If we have a scale but no suggested values in request, determine them
-            if 'next_order' not in request.GET:
-                max_order = LikertScaleResponseOption.objects.filter(
-                    likert_scale=scale
-                ).aggregate(models.Max('option_order'))['option_order__max'] or 0
-                suggested_order = max_order + 1
-                
-            if 'next_value' not in request.GET:
-                max_value = LikertScaleResponseOption.objects.filter(
+            # with a single aggregate query
+            if 'next_order' not in request.GET or 'next_value' not in request.GET:
+                option_maxima = LikertScaleResponseOption.objects.filter(
                     likert_scale=scale
-                ).aggregate(models.Max('option_value'))['option_value__max'] or 0
-                suggested_value = float(max_value) + 1
+                ).aggregate(
+                    max_order=models.Max('option_order'),
+                    max_value=models.Max('option_value')
+                )
+                if 'next_order' not in request.GET:
+                    suggested_order = (option_maxima['max_order'] or 0) + 1
+                if 'next_value' not in request.GET:
+                    suggested_value = float(option_maxima['max_value'] or 0) + 1
         except LikertScale.DoesNotExist:
-            print(f"LikertScale with ID {scale_id} not found")
+            logger.debug("LikertScale with ID %s not found", scale_id)
     
     # Render a new empty form row
     context = {
@@ -1023,8 +1069,10 @@ def add_likert_option(request):
         'suggested_value': suggested_value,
     }
     
-    # Log debug info
-    print(f"Adding option row with index {form_index}, scale_id: {scale_id}, suggested_order: {suggested_order}, suggested_value: {suggested_value}")
+    logger.debug(
+        "Adding option row with index %s, scale_id: %s, suggested_order: %s, suggested_value: %s",
+        form_index, scale_id, suggested_order, suggested_value
+    )
     
     return render(request, 'promapp/likert_option_row.html', context)
 
@@ -1044,7 +1092,8 @@ class LikertScaleListView(LoginRequiredMixin, PermissionRequiredMixin, ListView)
     paginate_by = 10  # Show 10 likert scales per page
     
     def get_queryset(self):
-        queryset = LikertScale.objects.all()
+        # Only load the columns the list table displays
+        queryset = LikertScale.objects.only('id', 'likert_scale_name', 'created_date')
         
         # Apply search filter if provided
         search = self.request.GET.get('search')
@@ -1093,36 +1142,36 @@ class LikertScaleListView(LoginRequiredMixin, PermissionRequiredMixin, ListView)
             
         return queryset.order_by('-created_date')
     
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        
+    def get_likert_scales_with_options(self, likert_scales):
+        """
+        Build the options and per-language translation status shown for each scale in
+        the list table.
+        """
         # Add response options for each likert scale
         likert_scales_with_options = []
         current_language = get_language()
         
-        for scale in context['likert_scales']:
+        for scale in likert_scales:
             options = LikertScaleResponseOption.objects.language(current_language).filter(
                 likert_scale=scale
-            ).order_by('option_order')
+            ).order_by('option_order').prefetch_related('translations')
             
             # Add translation status for each option
             options_with_translation_status = []
             for option in options:
                 # Get all existing translations for this option
-                existing_translations = set(
-                    option.translations.values_list('language_code', flat=True)
-                )
+                existing_translations = {
+                    option_translation.language_code: option_translation
+                    for option_translation in option.translations.all()
+                }
                 
                 translation_status = []
                 for lang_code, lang_name in settings.LANGUAGES:
                     has_translation = lang_code in existing_translations
                     # Check if translation has content (not just empty strings)
                     if has_translation:
-                        try:
-                            translation = option.translations.get(language_code=lang_code)
-                            has_content = bool(translation.option_text and translation.option_text.strip())
-                        except option.translations.model.DoesNotExist:
-                            has_content = False
+                        translation = existing_translations[lang_code]
+                        has_content = bool(translation.option_text and translation.option_text.strip())
                     else:
                         has_content = False
                         
@@ -1158,10 +1207,22 @@ class LikertScaleListView(LoginRequiredMixin, PermissionRequiredMixin, ListView)
                 'translation_counts': translation_counts
             })
         
-        context['likert_scales_with_options'] = likert_scales_with_options
+        return likert_scales_with_options
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        
+        # The table fragment is cached, so the per-scale option and translation queries
+        # only run when the fragment is actually rendered
+        likert_scales = context['likert_scales']
+        context['likert_scales_with_options'] = SimpleLazyObject(
+            lambda: self.get_likert_scales_with_options(likert_scales)
+        )
         context['available_languages'] = settings.LANGUAGES
         context['search_query'] = self.request.GET.get('search', '')
-        context['is_htmx'] = bool(self.request.META.get('HTTP_HX_REQUEST'))
+        context['is_htmx'] = bool(self.request.htmx)
+        
+        context['scale_list_cache_version'] = get_scale_list_cache_version()
         
         # Create filters for the search component
         context['likert_scale_filters'] = [
@@ -1195,7 +1256,7 @@ class LikertScaleListView(LoginRequiredMixin, PermissionRequiredMixin, ListView)
     
     def get(self, request, *args, **kwargs):
         # Check if this is an HTMX request
-        if request.META.get('HTTP_HX_REQUEST'):
+        if request.htmx:
             # For HTMX requests, let Django handle pagination normally
             # but just return the partial template
             response = super().get(request, *args, **kwargs)
@@ -1221,7 +1282,7 @@ def create_range_scale(request):
     
     if edit_id:
         instance = get_object_or_404(RangeScale, pk=edit_id)
-        print(f"Editing range scale: {instance.range_scale_name} (ID: {instance.id})")
+        logger.debug("Editing range scale: %s (ID: %s)", instance.range_scale_name, instance.id)
     
     if request.method == 'POST':
         form = RangeScaleForm(request.POST, instance=instance)
@@ -1253,8 +1314,7 @@ def create_range_scale(request):
                 messages.error(request, str(e))
             except Exception as e:
                 # Log detailed error but show generic message
-                logger = logging.getLogger("promapp.range_scale_management")
-                logger.error(f"Unexpected error saving range scale: {str(e)}")
+                logger.error("Unexpected error saving range scale: %s", e)
                 messages.error(request, "Error saving range scale. Please check your input and try again.")
         else:
             messages.error(request, "Please check the form for errors.")
@@ -1280,7 +1340,10 @@ class RangeScaleListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
     paginate_by = 10  # Show 10 range scales per page
     
     def get_queryset(self):
-        queryset = RangeScale.objects.all()
+        # Only load the columns the list table displays
+        queryset = RangeScale.objects.only(
+            'id', 'range_scale_name', 'min_value', 'max_value', 'increment', 'created_date'
+        )
         
         # Apply search filter if provided
         search = self.request.GET.get('search')
@@ -1322,7 +1385,7 @@ class RangeScaleListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['search_query'] = self.request.GET.get('search', '')
-        context['is_htmx'] = bool(self.request.META.get('HTTP_HX_REQUEST'))
+        context['is_htmx'] = bool(self.request.htmx)
         
         # Add available languages to context
         context['available_languages'] = settings.LANGUAGES
@@ -1330,6 +1393,8 @@ class RangeScaleListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
         # Add current language to context for translation links
         context['current_language'] = get_language()
         
+        context['scale_list_cache_version'] = get_scale_list_cache_version()
+        
         # Create filters for the search component
         context['range_scale_filters'] = [
             {
@@ -1361,7 +1426,7 @@ class RangeScaleListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
     
     def get(self, request, *args, **kwargs):
         # Check if this is an HTMX request
-        if request.META.get('HTTP_HX_REQUEST'):
+        if request.htmx:
             # For HTMX requests, let Django handle pagination normally
             # but just return the partial template
             response = super().get(request, *args, **kwargs)
@@ -1391,7 +1456,10 @@ class ConstructScaleListView(LoginRequiredMixin, PermissionRequiredMixin, ListVi
     paginate_by = 25  # Show 25 items per page
     
     def get_queryset(self):
-        queryset = ConstructScale.objects.all()
+        # Only load the columns the list table displays
+        queryset = ConstructScale.objects.only(
+            'id', 'name', 'instrument_name', 'instrument_version', 'scale_equation', 'created_date'
+        )
         
         # Apply search filter if provided
         search = self.request.GET.get('search')
@@ -1416,7 +1484,7 @@ class ConstructScaleListView(LoginRequiredMixin, PermissionRequiredMixin, ListVi
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['search_query'] = self.request.GET.get('search', '')
-        context['is_htmx'] = bool(self.request.META.get('HTTP_HX_REQUEST'))
+        context['is_htmx'] = bool(self.request.htmx)
         
         # Get unique instrument names for filter
         instrument_names = ConstructScale.objects.exclude(
@@ -1425,6 +1493,8 @@ class ConstructScaleListView(LoginRequiredMixin, PermissionRequiredMixin, ListVi
             instrument_name=''
         ).values_list('instrument_name', flat=True).distinct().order_by('instrument_name')
         
+        context['scale_list_cache_version'] = get_scale_list_cache_version()
+        
         # Create filters for the search component
         context['construct_scale_filters'] = [
             {
@@ -1452,7 +1522,7 @@ class ConstructScaleListView(LoginRequiredMixin, PermissionRequiredMixin, ListVi
     
     def get(self, request, *args, **kwargs):
         # Check if this is an HTMX request
-        if request.META.get('HTTP_HX_REQUEST'):
+        if request.htmx:
             # For HTMX requests, let Django handle pagination normally
             # but just return the partial template
             response = super().get(request, *args, **kwargs)
@@ -1495,7 +1565,17 @@ class QuestionnaireResponseView(LoginRequiredMixin, PermissionRequiredMixin, Use
 
     def get_queryset(self):
         # Only allow access to questionnaires assigned to the current patient
-        return PatientQuestionnaire.objects.filter(patient=self.request.user.patient)
+        return PatientQuestionnaire.objects.filter(
+            patient=self.request.user.patient
+        ).select_related('questionnaire', 'patient__user')
+
+    def get_object(self, queryset=None):
+        # dispatch, get and post all need the object, so only fetch it once per request
+        if queryset is not None:
+            return super().get_object(queryset)
+        if not hasattr(self, '_object'):
+            self._object = super().get_object()
+        return self._object
 
     def check_interval(self, patient_questionnaire):
         # Get the last submission for this questionnaire by this patient
@@ -1615,42 +1695,43 @@ class QuestionnaireResponseView(LoginRequiredMixin, PermissionRequiredMixin, Use
         Find the next available questionnaire that can be answered.
         Returns the PatientQuestionnaire object or None if no more questionnaires are available.
         """
-        # Get all questionnaires for this patient, ordered by questionnaire_order
-        patient_questionnaires = PatientQuestionnaire.objects.filter(
-            patient=self.request.user.patient,
-            display_questionnaire=True
-        ).select_related('questionnaire').order_by('questionnaire__questionnaire_order')
+        # Fetch the subsequent questionnaires for this patient in one query, with the
+        # date of their most recent submission annotated instead of queried per row
+        last_submission_date = QuestionnaireSubmission.objects.filter(
+            patient_questionnaire=OuterRef('pk')
+        ).order_by('-submission_date').values('submission_date')[:1]
         
-        # Find questionnaires that come after the current one in the sequence
         current_order = current_patient_questionnaire.questionnaire.questionnaire_order
-        next_questionnaires = patient_questionnaires.filter(
+        next_questionnaires = PatientQuestionnaire.objects.filter(
+            patient=self.request.user.patient,
+            display_questionnaire=True,
             questionnaire__questionnaire_order__gt=current_order
-        )
+        ).select_related('questionnaire').only(
+            'id',
+            'display_questionnaire',
+            'questionnaire__id',
+            'questionnaire__questionnaire_order',
+            'questionnaire__questionnaire_answer_interval'
+        ).annotate(
+            last_submission_date=Subquery(last_submission_date)
+        ).order_by('questionnaire__questionnaire_order')
         
         # Check each subsequent questionnaire to see if it can be answered
+        now = timezone.now()
         for pq in next_questionnaires:
-            # Get the last submission for this questionnaire
-            last_submission = QuestionnaireSubmission.objects.filter(
-                patient_questionnaire=pq
-            ).order_by('-submission_date').first()
-            
-            if last_submission:
-                # Calculate when the questionnaire can be answered next
-                interval_seconds = pq.questionnaire.questionnaire_answer_interval
-                
-                # Handle special case: if interval is 0, allow immediate re-answering
-                if interval_seconds == 0:
-                    return pq
-                # Handle edge case: if interval is negative, treat as 0
-                elif interval_seconds < 0:
-                    return pq
-                else:
-                    next_available = last_submission.submission_date + timezone.timedelta(seconds=interval_seconds)
-                    if timezone.now() >= next_available:
-                        return pq
-            else:
+            if pq.last_submission_date is None:
                 # If no previous submission, can answer immediately
                 return pq
+            
+            # Calculate when the questionnaire can be answered next
+            interval_seconds = pq.questionnaire.questionnaire_answer_interval
+            
+            # Handle special case: if interval is 0 (or negative), allow immediate re-answering
+            if interval_seconds <= 0:
+                return pq
+            next_available = pq.last_submission_date + timezone.timedelta(seconds=interval_seconds)
+            if now >= next_available:
+                return pq
         
         # No more available questionnaires
         return None
@@ -1747,20 +1828,29 @@ class PatientQuestionnaireManagementView(LoginRequiredMixin, PermissionRequiredM
         # Get all questionnaires with proper translation handling
         current_language = get_language()
         
-        # Get all questionnaires with their translations in the current language
-        all_questionnaires = Questionnaire.objects.filter(
-            translations__language_code=current_language
-        ).distinct('id').order_by('id', 'translations__name')
-        
-        # Get currently assigned questionnaires
+        # Get all questionnaires with a translation in the current language, ordered by the
+        # translated name. Subqueries avoid joining the translation table and DISTINCT ON.
+        current_translations = Questionnaire._parler_meta.root_model.objects.filter(
+            master=OuterRef('pk'),
+            language_code=current_language
+        )
+        all_questionnaires = Questionnaire.objects.annotate(
+            translated_name=Subquery(current_translations.values('name')[:1])
+        ).filter(
+            Exists(current_translations)
+        ).order_by('translated_name')
+        
+        # Get currently assigned questionnaires, keyed by questionnaire id so the
+        # loop below does a dict lookup instead of one query per questionnaire
         assigned_questionnaires = PatientQuestionnaire.objects.filter(
             patient=patient
         ).select_related('questionnaire')
+        assigned_map = {aq.questionnaire_id: aq for aq in assigned_questionnaires}
         
         # Create a list of questionnaires with their assignment status
         questionnaires_with_status = []
         for questionnaire in all_questionnaires:
-            assigned = assigned_questionnaires.filter(questionnaire=questionnaire).first()
+            assigned = assigned_map.get(questionnaire.id)
             questionnaires_with_status.append({
                 'questionnaire': questionnaire,
                 'is_assigned': bool(assigned),
@@ -1798,14 +1888,22 @@ class PatientQuestionnaireManagementView(LoginRequiredMixin, PermissionRequiredM
                 messages.success(request, _('Questionnaire unassigned successfully.'))
                 
             elif action == 'toggle_display':
-                # Toggle display status
-                patient_questionnaire = PatientQuestionnaire.objects.get(
+                # Toggle display status atomically in the database
+                assignment = PatientQuestionnaire.objects.filter(
                     patient=patient,
                     questionnaire=questionnaire
                 )
-                patient_questionnaire.display_questionnaire = not patient_questionnaire.display_questionnaire
-                patient_questionnaire.save()
-                status = 'displayed' if patient_questionnaire.display_questionnaire else 'hidden'
+                updated = assignment.update(
+                    display_questionnaire=models.Case(
+                        models.When(display_questionnaire=True, then=Value(False)),
+                        default=Value(True)
+                    ),
+                    modified_date=timezone.now()
+                )
+                if not updated:
+                    raise PatientQuestionnaire.DoesNotExist
+                is_displayed = assignment.values_list('display_questionnaire', flat=True).first()
+                status = 'displayed' if is_displayed else 'hidden'
                 messages.success(request, _(f'Questionnaire is now {status}.'))
                 
         except Questionnaire.DoesNotExist:
@@ -1826,9 +1924,26 @@ class PatientQuestionnaireListView(LoginRequiredMixin, PermissionRequiredMixin,
     context_object_name = 'patients'
     permission_required = 'promapp.view_patientquestionnaire'
     paginate_by = 25
+    paginator_class = CachedCountPaginator
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        # Cache the total count per user and filter combination so later pages skip the
+        # COUNT query. The version changes whenever patients or assignments change.
+        cache_key_params = {
+            'version': get_patient_questionnaire_list_cache_version(),
+            'user': self.request.user.pk,
+            'search': self.request.GET.get('search', ''),
+            'questionnaire_count': self.request.GET.get('questionnaire_count', ''),
+            'sort': self.request.GET.get('sort', 'name'),
+        }
+        cache_key_hash = hashlib.md5(json.dumps(cache_key_params, sort_keys=True).encode()).hexdigest()
+        kwargs['count_cache_key'] = f"patient_questionnaire_list_count_{cache_key_hash}"
+        return super().get_paginator(queryset, per_page, orphans, allow_empty_first_page, **kwargs)
 
     def get_queryset(self):
-        queryset = Patient.objects.select_related('user').all()
+        queryset = Patient.objects.select_related('user').only(
+            'id', 'name', 'patient_id', 'user__username'
+        )
         
         # Apply search filter
         search_query = self.request.GET.get('search')
@@ -1879,23 +1994,42 @@ class PatientQuestionnaireListView(LoginRequiredMixin, PermissionRequiredMixin,
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         current_language = get_language()
-        for patient in context['patients']:
+        
+        # Prefetch the assignments of the patients on this page together with the
+        # questionnaire translation in the current language, instead of querying per patient
+        patients = list(context['patients'])
+        models.prefetch_related_objects(
+            patients,
+            Prefetch(
+                'patientquestionnaire_set',
+                queryset=PatientQuestionnaire.objects.only(
+                    'id', 'patient_id', 'questionnaire_id'
+                ).prefetch_related(
+                    Prefetch(
+                        'questionnaire__translations',
+                        queryset=Questionnaire._parler_meta.root_model.objects.filter(
+                            language_code=current_language
+                        ),
+                        to_attr='current_translations'
+                    )
+                ),
+                to_attr='assigned_questionnaires'
+            )
+        )
+        
+        for patient in patients:
             # Count only unique questionnaire assignments
-            patient.questionnaire_count = PatientQuestionnaire.objects.filter(
-                patient=patient
-            ).values('questionnaire').distinct().count()
+            unique_questionnaires = {
+                pq.questionnaire_id: pq.questionnaire for pq in patient.assigned_questionnaires
+            }
+            patient.questionnaire_count = len(unique_questionnaires)
             
-            # Get unique questionnaire names in current language using a subquery
-            questionnaire_ids = PatientQuestionnaire.objects.filter(
-                patient=patient
-            ).values_list('questionnaire_id', flat=True).distinct()
-            
-            patient.questionnaire_names = list(
-                Questionnaire.objects.filter(
-                    id__in=questionnaire_ids,
-                    translations__language_code=current_language
-                ).values_list('translations__name', flat=True)
-            )
+            # Unique questionnaire names in current language
+            patient.questionnaire_names = [
+                questionnaire_translation.name
+                for questionnaire in unique_questionnaires.values()
+                for questionnaire_translation in questionnaire.current_translations
+            ]
             
         # Add dropdown options for filter components
         from django.utils.translation import gettext as _
@@ -1929,46 +2063,39 @@ class MyQuestionnaireListView(LoginRequiredMixin, ListView):
     context_object_name = 'patient_questionnaires'
 
     def get_queryset(self):
-        # Only show questionnaires for the logged-in patient, ordered by questionnaire_order
+        # Only show questionnaires for the logged-in patient, ordered by questionnaire_order.
+        # The last submission date and the time the questionnaire can next be answered are
+        # computed in the database so the whole page is served by a single query.
+        last_submission_date = QuestionnaireSubmission.objects.filter(
+            patient_questionnaire=OuterRef('pk')
+        ).order_by('-submission_date').values('submission_date')[:1]
+        
+        # Negative intervals (shouldn't happen with validation) are treated as 0
+        answer_interval = ExpressionWrapper(
+            Greatest(F('questionnaire__questionnaire_answer_interval'), Value(0)) * Value(timezone.timedelta(seconds=1)),
+            output_field=models.DurationField()
+        )
+        
         return PatientQuestionnaire.objects.filter(
             patient__user=self.request.user,
             display_questionnaire=True
-        ).select_related('questionnaire').order_by('questionnaire__questionnaire_order')
+        ).select_related('questionnaire').annotate(
+            last_submission_date=Subquery(last_submission_date)
+        ).annotate(
+            next_available=ExpressionWrapper(
+                F('last_submission_date') + answer_interval,
+                output_field=models.DateTimeField()
+            )
+        ).order_by('questionnaire__questionnaire_order')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['patient'] = getattr(self.request.user, 'patient', None)
         
-        # Add information about when each questionnaire can be answered next
+        # A questionnaire without previous submissions can be answered immediately
+        now = timezone.now()
         for pq in context['patient_questionnaires']:
-            # Get the last submission for this questionnaire
-            last_submission = QuestionnaireSubmission.objects.filter(
-                patient_questionnaire=pq
-            ).order_by('-submission_date').first()
-            
-            # Store the last submission for display
-            pq.last_submission = last_submission
-            
-            if last_submission:
-                # Calculate when the questionnaire can be answered next
-                interval_seconds = pq.questionnaire.questionnaire_answer_interval
-                
-                # Handle special case: if interval is 0, allow immediate re-answering
-                if interval_seconds == 0:
-                    pq.next_available = last_submission.submission_date
-                    pq.can_answer = True
-                # Handle edge case: if interval is negative (shouldn't happen with validation), treat as 0
-                elif interval_seconds < 0:
-                    pq.next_available = last_submission.submission_date
-                    pq.can_answer = True
-                else:
-                    next_available = last_submission.submission_date + timezone.timedelta(seconds=interval_seconds)
-                    pq.next_available = next_available
-                    pq.can_answer = timezone.now() >= next_available
-            else:
-                # If no previous submission, can answer immediately
-                pq.next_available = None
-                pq.can_answer = True
+            pq.can_answer = pq.next_available is None or now >= pq.next_available
         
         return context
 
@@ -2035,7 +2162,21 @@ class QuestionnaireItemRuleCreateView(LoginRequiredMixin, PermissionRequiredMixi
         return reverse('questionnaire_item_rules_list', 
                       kwargs={'questionnaire_item_id': self.kwargs['questionnaire_item_id']})
 
-class QuestionnaireItemRuleUpdateView(LoginRequiredMixin, PermissionRequiredMixin, UpdateView):
+class _QuestionnaireItemRuleMixin:
+    """
+    Shared by the rule and rule group update/delete views. Loads the owning questionnaire
+    item with the object and redirects back to its list view (named by success_url_name).
+    """
+    success_url_name = None
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('questionnaire_item__item')
+
+    def get_success_url(self):
+        return reverse(self.success_url_name, 
+                      kwargs={'questionnaire_item_id': self.object.questionnaire_item_id})
+
+class QuestionnaireItemRuleUpdateView(LoginRequiredMixin, PermissionRequiredMixin, _QuestionnaireItemRuleMixin, UpdateView):
     """
     View for updating an existing rule.
     """
@@ -2043,6 +2184,7 @@ class QuestionnaireItemRuleUpdateView(LoginRequiredMixin, PermissionRequiredMixi
     form_class = QuestionnaireItemRuleForm
     template_name = 'promapp/questionnaire_item_rule_form.html'
     permission_required = 'promapp.change_questionnaireitemrule'
+    success_url_name = 'questionnaire_item_rules_list'
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -2050,20 +2192,13 @@ class QuestionnaireItemRuleUpdateView(LoginRequiredMixin, PermissionRequiredMixi
         context['is_required_item'] = self.object.questionnaire_item.item.is_required
         return context
 
-    def get_success_url(self):
-        return reverse('questionnaire_item_rules_list', 
-                      kwargs={'questionnaire_item_id': self.object.questionnaire_item.id})
-
-class QuestionnaireItemRuleDeleteView(LoginRequiredMixin, PermissionRequiredMixin, DeleteView):
+class QuestionnaireItemRuleDeleteView(LoginRequiredMixin, PermissionRequiredMixin, _QuestionnaireItemRuleMixin, DeleteView):
     """
     View for deleting a rule.
     """
     model = QuestionnaireItemRule
     permission_required = 'promapp.delete_questionnaireitemrule'
-
-    def get_success_url(self):
-        return reverse('questionnaire_item_rules_list', 
-                      kwargs={'questionnaire_item_id': self.object.questionnaire_item.id})
+    success_url_name = 'questionnaire_item_rules_list'
 
 class QuestionnaireItemRuleGroupListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
     """
@@ -2074,20 +2209,23 @@ class QuestionnaireItemRuleGroupListView(LoginRequiredMixin, PermissionRequiredM
     context_object_name = 'rule_groups'
     permission_required = 'promapp.view_questionnaireitemrulegroup'
 
+    def dispatch(self, request, *args, **kwargs):
+        # Look up the questionnaire item once and reuse it in all view hooks
+        self.questionnaire_item = get_object_or_404(
+            QuestionnaireItem.objects.select_related('item'),
+            pk=kwargs['questionnaire_item_id']
+        )
+        return super().dispatch(request, *args, **kwargs)
+
     def get_queryset(self):
-        questionnaire_item = get_object_or_404(QuestionnaireItem, pk=self.kwargs['questionnaire_item_id'])
         return QuestionnaireItemRuleGroup.objects.filter(
-            questionnaire_item=questionnaire_item
+            questionnaire_item=self.questionnaire_item
         ).order_by('group_order')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        questionnaire_item = get_object_or_404(
-            QuestionnaireItem, 
-            pk=self.kwargs['questionnaire_item_id']
-        )
-        context['questionnaire_item'] = questionnaire_item
-        context['is_required_item'] = questionnaire_item.item.is_required
+        context['questionnaire_item'] = self.questionnaire_item
+        context['is_required_item'] = self.questionnaire_item.item.is_required
         return context
 
 class QuestionnaireItemRuleGroupCreateView(LoginRequiredMixin, PermissionRequiredMixin, CreateView):
@@ -2099,31 +2237,31 @@ class QuestionnaireItemRuleGroupCreateView(LoginRequiredMixin, PermissionRequire
     template_name = 'promapp/questionnaire_item_rule_group_form.html'
     permission_required = 'promapp.add_questionnaireitemrulegroup'
 
+    def dispatch(self, request, *args, **kwargs):
+        # Look up the questionnaire item once and reuse it in all view hooks
+        self.questionnaire_item = get_object_or_404(
+            QuestionnaireItem.objects.select_related('item'),
+            pk=kwargs['questionnaire_item_id']
+        )
+        return super().dispatch(request, *args, **kwargs)
+
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
-        questionnaire_item = get_object_or_404(QuestionnaireItem, pk=self.kwargs['questionnaire_item_id'])
         kwargs['initial'] = kwargs.get('initial', {})
-        kwargs['initial']['questionnaire_item'] = questionnaire_item
+        kwargs['initial']['questionnaire_item'] = self.questionnaire_item
         return kwargs
 
     def get_form(self, form_class=None):
         form = super().get_form(form_class)
-        form.instance.questionnaire_item = get_object_or_404(
-            QuestionnaireItem, 
-            pk=self.kwargs['questionnaire_item_id']
-        )
+        form.instance.questionnaire_item = self.questionnaire_item
         return form
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        questionnaire_item = get_object_or_404(
-            QuestionnaireItem, 
-            pk=self.kwargs['questionnaire_item_id']
-        )
-        context['questionnaire_item'] = questionnaire_item
-        context['is_required_item'] = questionnaire_item.item.is_required
+        context['questionnaire_item'] = self.questionnaire_item
+        context['is_required_item'] = self.questionnaire_item.item.is_required
         context['available_rules'] = QuestionnaireItemRule.objects.filter(
-            questionnaire_item=questionnaire_item
+            questionnaire_item=self.questionnaire_item
         ).order_by('rule_order')
         return context
 
@@ -2131,7 +2269,7 @@ class QuestionnaireItemRuleGroupCreateView(LoginRequiredMixin, PermissionRequire
         return reverse('questionnaire_item_rule_groups_list', 
                       kwargs={'questionnaire_item_id': self.kwargs['questionnaire_item_id']})
 
-class QuestionnaireItemRuleGroupUpdateView(LoginRequiredMixin, PermissionRequiredMixin, UpdateView):
+class QuestionnaireItemRuleGroupUpdateView(LoginRequiredMixin, PermissionRequiredMixin, _QuestionnaireItemRuleMixin, UpdateView):
     """
     View for updating an existing rule group.
     """
@@ -2139,6 +2277,7 @@ class QuestionnaireItemRuleGroupUpdateView(LoginRequiredMixin, PermissionRequire
     form_class = QuestionnaireItemRuleGroupForm
     template_name = 'promapp/questionnaire_item_rule_group_form.html'
     permission_required = 'promapp.change_questionnaireitemrulegroup'
+    success_url_name = 'questionnaire_item_rule_groups_list'
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -2149,20 +2288,13 @@ class QuestionnaireItemRuleGroupUpdateView(LoginRequiredMixin, PermissionRequire
         ).order_by('rule_order')
         return context
 
-    def get_success_url(self):
-        return reverse('questionnaire_item_rule_groups_list', 
-                      kwargs={'questionnaire_item_id': self.object.questionnaire_item.id})
-
-class QuestionnaireItemRuleGroupDeleteView(LoginRequiredMixin, PermissionRequiredMixin, DeleteView):
+class QuestionnaireItemRuleGroupDeleteView(LoginRequiredMixin, PermissionRequiredMixin, _QuestionnaireItemRuleMixin, DeleteView):
     """
     View for deleting a rule group.
     """
     model = QuestionnaireItemRuleGroup
     permission_required = 'promapp.delete_questionnaireitemrulegroup'
-
-    def get_success_url(self):
-        return reverse('questionnaire_item_rule_groups_list', 
-                      kwargs={'questionnaire_item_id': self.object.questionnaire_item.id})
+    success_url_name = 'questionnaire_item_rule_groups_list'
 
 # Export Questionnaire Responses Views
 class QuestionnaireExportListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
@@ -2194,7 +2326,7 @@ class QuestionnaireExportListView(LoginRequiredMixin, PermissionRequiredMixin, L
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['search_query'] = self.request.GET.get('search', '')
-        context['is_htmx'] = bool(self.request.META.get('HTTP_HX_REQUEST'))
+        context['is_htmx'] = bool(self.request.htmx)
         
         return context
 
@@ -2241,7 +2373,7 @@ class QuestionnaireExportPatientListView(LoginRequiredMixin, PermissionRequiredM
         context = super().get_context_data(**kwargs)
         context['questionnaire'] = self.questionnaire
         context['search_query'] = self.request.GET.get('search', '')
-        context['is_htmx'] = bool(self.request.META.get('HTTP_HX_REQUEST'))
+        context['is_htmx'] = bool(self.request.htmx)
         
         # For each patient, get the number of submissions they have for this questionnaire
         patients_with_submission_count = []
@@ -2361,6 +2493,35 @@ def export_questionnaire_responses(request, questionnaire_id, patient_id=None):
     return http_response
 
 # HTMX Views for Rule Forms
+def _get_dependent_item(request, item_id):
+    """
+    Get the dependent QuestionnaireItem used by the rule form validators, with its item
+    and response scales loaded in one go. The result is memoized on the request, so
+    repeated lookups of the same item while handling it do not query again.
+    Raises QuestionnaireItem.DoesNotExist for unknown or malformed ids.
+    """
+    try:
+        item_uuid = uuid.UUID(str(item_id))
+    except ValueError:
+        raise QuestionnaireItem.DoesNotExist
+    
+    if not hasattr(request, '_dependent_items'):
+        request._dependent_items = {}
+    if item_uuid not in request._dependent_items:
+        request._dependent_items[item_uuid] = QuestionnaireItem.objects.select_related(
+            'item', 'item__likert_response', 'item__range_response'
+        ).get(id=item_uuid)
+    return request._dependent_items[item_uuid]
+
+def _validator_etag(request):
+    """
+    ETag for the HTMX validators that do not read the database: their feedback depends
+    only on the query string and the active language.
+    """
+    key = f"{get_language()}:{request.META.get('QUERY_STRING', '')}"
+    return hashlib.md5(key.encode()).hexdigest()
+
+@cache_control(private=True, max_age=5)
 def validate_dependent_item(request):
     """Validate the selected dependent item and return appropriate feedback."""
     item_id = request.GET.get('dependent_item')
@@ -2368,11 +2529,12 @@ def validate_dependent_item(request):
         return HttpResponse(_("Please select a dependent item."))
     
     try:
-        item = QuestionnaireItem.objects.get(id=item_id)
+        item = _get_dependent_item(request, item_id)
         return HttpResponse(_("Selected item: {}").format(item.item.name))
     except QuestionnaireItem.DoesNotExist:
         return HttpResponse(_("Invalid item selected."))
 
+@cache_control(private=True, max_age=5)
 def validate_rule_operator(request):
     """Validate the selected operator and return appropriate feedback."""
     operator = request.GET.get('operator')
@@ -2382,7 +2544,7 @@ def validate_rule_operator(request):
         return HttpResponse(_("Please select an operator."))
     
     try:
-        dependent_item = QuestionnaireItem.objects.get(id=dependent_item_id)
+        dependent_item = _get_dependent_item(request, dependent_item_id)
         response_type = dependent_item.item.response_type
         
         # Return appropriate feedback based on response type
@@ -2393,6 +2555,7 @@ def validate_rule_operator(request):
     except QuestionnaireItem.DoesNotExist:
         return HttpResponse(_("Invalid dependent item."))
 
+@cache_control(private=True, max_age=5)
 def validate_comparison_value(request):
     """Validate the comparison value based on the dependent item's response type."""
     value = request.GET.get('comparison_value')
@@ -2402,7 +2565,7 @@ def validate_comparison_value(request):
         return HttpResponse(_("Please enter a comparison value."))
     
     try:
-        dependent_item = QuestionnaireItem.objects.get(id=dependent_item_id)
+        dependent_item = _get_dependent_item(request, dependent_item_id)
         response_type = dependent_item.item.response_type
         
         if response_type == 'Number':
@@ -2414,8 +2577,7 @@ def validate_comparison_value(request):
         elif response_type == 'Likert':
             try:
                 float_value = float(value)
-                likert_options = dependent_item.item.likert_response.likertscaleresponseoption_set.all()
-                valid_values = [option.option_value for option in likert_options]
+                valid_values = dependent_item.item.likert_response.get_option_values()
                 if float_value in valid_values:
                     return HttpResponse(_("Valid Likert scale value."))
                 else:
@@ -2438,6 +2600,8 @@ def validate_comparison_value(request):
     except QuestionnaireItem.DoesNotExist:
         return HttpResponse(_("Invalid dependent item."))
 
+@cache_page(60)
+@etag(_validator_etag)
 def validate_logical_operator(request):
     """Validate the logical operator selection."""
     operator = request.GET.get('logical_operator')
@@ -2445,31 +2609,30 @@ def validate_logical_operator(request):
         return HttpResponse(_("Please select a logical operator."))
     return HttpResponse(_("Valid logical operator."))
 
-def validate_rule_order(request):
-    """Validate the rule order."""
-    order = request.GET.get('rule_order')
-    if not order:
-        return HttpResponse(_("Please enter a rule order."))
+def _validate_positive_int(request, field, empty_message, valid_message):
+    """Shared check for the order validators: the value must be a whole number greater than 0."""
+    raw = request.GET.get(field, '').strip()
+    if not raw:
+        return HttpResponse(empty_message)
     try:
-        order_num = int(order)
-        if order_num < 1:
-            return HttpResponse(_("Order must be greater than 0."))
-        return HttpResponse(_("Valid rule order."))
+        value = int(raw)
     except ValueError:
         return HttpResponse(_("Please enter a valid number."))
+    if value < 1:
+        return HttpResponse(_("Order must be greater than 0."))
+    return HttpResponse(valid_message)
+
+@cache_page(60)
+@etag(_validator_etag)
+def validate_rule_order(request):
+    """Validate the rule order."""
+    return _validate_positive_int(request, 'rule_order', _("Please enter a rule order."), _("Valid rule order."))
 
+@cache_page(60)
+@etag(_validator_etag)
 def validate_group_order(request):
     """Validate the group order."""
-    order = request.GET.get('group_order')
-    if not order:
-        return HttpResponse(_("Please enter a group order."))
-    try:
-        order_num = int(order)
-        if order_num < 1:
-            return HttpResponse(_("Order must be greater than 0."))
-        return HttpResponse(_("Valid group order."))
-    except ValueError:
-        return HttpResponse(_("Please enter a valid number."))
+    return _validate_positive_int(request, 'group_order', _("Please enter a group order."), _("Valid group order."))
 
 def validate_rule_selection(request):
     """Validate the selected rules for a rule group."""
@@ -2479,12 +2642,12 @@ def validate_rule_selection(request):
     
     try:
         rules = QuestionnaireItemRule.objects.filter(id__in=rule_ids)
-        if len(rules) != len(rule_ids):
+        if rules.count() != len(rule_ids):
             return HttpResponse(_("One or more invalid rules selected."))
         
         # Check if all rules belong to the same questionnaire item
-        questionnaire_items = set(rule.questionnaire_item for rule in rules)
-        if len(questionnaire_items) > 1:
+        questionnaire_item_ids = rules.order_by().values_list('questionnaire_item_id', flat=True).distinct()
+        if len(questionnaire_item_ids) > 1:
             return HttpResponse(_("All rules must belong to the same questionnaire item."))
         
         return HttpResponse(_("Valid rule selection."))
@@ -2496,6 +2659,12 @@ def rule_summary(request, questionnaire_item_id):
     questionnaire_item = get_object_or_404(QuestionnaireItem, pk=questionnaire_item_id)
     rules = QuestionnaireItemRule.objects.filter(
         questionnaire_item=questionnaire_item
+    ).select_related(
+        'dependent_item__item'
+    ).prefetch_related(
+        'dependent_item__item__translations'
+    ).only(
+        'id', 'rule_order', 'operator', 'comparison_value', 'logical_operator', 'dependent_item__item'
     ).order_by('rule_order')
     
     return render(request, 'promapp/partials/rule_summary.html', {
@@ -2507,12 +2676,21 @@ def rule_group_summary(request, questionnaire_item_id):
     questionnaire_item = get_object_or_404(QuestionnaireItem, pk=questionnaire_item_id)
     rule_groups = QuestionnaireItemRuleGroup.objects.filter(
         questionnaire_item=questionnaire_item
+    ).only('id', 'group_order').prefetch_related(
+        Prefetch('rules', queryset=QuestionnaireItemRule.objects.only('id', 'rule_order'))
     ).order_by('group_order')
     
     return render(request, 'promapp/partials/rule_group_summary.html', {
         'rule_groups': rule_groups
     })
 
+def _parse_uuid(value):
+    """Return value as a UUID, or None if it is not a valid one."""
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
 def save_question_numbers(request, pk):
     """View to handle saving question numbers via AJAX."""
     if request.method != 'POST':
@@ -2522,9 +2700,13 @@ def save_question_numbers(request, pk):
         questionnaire = get_object_or_404(Questionnaire, pk=pk)
         
         # Parse the JSON data
-        data = json.loads(request.body)
-        question_numbers = data.get('question_numbers', {})
-        removed_items = data.get('removed_items', [])
+        data = _load_json_body(request)
+        # Item ids arrive as strings; parse them once so the lookups below can use the UUID keys
+        question_numbers = [
+            (_parse_uuid(item_id), new_number)
+            for item_id, new_number in data.get('question_numbers', {}).items()
+        ]
+        removed_items = [_parse_uuid(item_id) for item_id in data.get('removed_items', [])]
         
         if not question_numbers and not removed_items:
             return JsonResponse({
@@ -2538,13 +2720,25 @@ def save_question_numbers(request, pk):
         ).select_related('item')
         
         # Create a mapping of item IDs to questionnaire items
-        item_map = {str(qi.item.id): qi for qi in questionnaire_items}
+        item_map = {qi.item_id: qi for qi in questionnaire_items}
+        
+        # Load all rules touching this questionnaire once and index them by the item they
+        # belong to and the item they depend on, so the checks below need no further queries
+        all_rules = QuestionnaireItemRule.objects.filter(
+            models.Q(questionnaire_item__questionnaire=questionnaire) |
+            models.Q(dependent_item__questionnaire=questionnaire)
+        ).select_related('questionnaire_item__item', 'dependent_item__item')
+        rules_by_item = defaultdict(list)
+        rules_by_dependent_item = defaultdict(list)
+        for rule in all_rules:
+            rules_by_item[rule.questionnaire_item_id].append(rule)
+            rules_by_dependent_item[rule.dependent_item_id].append(rule)
         
         # Track used question numbers
         used_numbers = set()
         
         # First pass: Validate all changes
-        for item_id, new_number in question_numbers.items():
+        for item_id, new_number in question_numbers:
             if new_number in used_numbers:
                 return JsonResponse({
                     'success': False,
@@ -2556,17 +2750,14 @@ def save_question_numbers(request, pk):
                 qi = item_map[item_id]
                 if qi.question_number != new_number:
                     # Check for rule conflicts
-                    affected_rules = QuestionnaireItemRule.objects.filter(
-                        models.Q(
-                            questionnaire_item=qi,
-                            dependent_item__question_number__gte=new_number
-                        ) |
-                        models.Q(
-                            dependent_item=qi,
-                            questionnaire_item__question_number__lte=new_number
-                        )
-                    )
-                    if affected_rules.exists():
+                    affected_rules = [
+                        rule for rule in rules_by_item[qi.id]
+                        if rule.dependent_item.question_number >= new_number
+                    ] + [
+                        rule for rule in rules_by_dependent_item[qi.id]
+                        if rule.questionnaire_item.question_number <= new_number
+                    ]
+                    if affected_rules:
                         rule_details = []
                         for rule in affected_rules:
                             rule_details.append(
@@ -2586,58 +2777,92 @@ def save_question_numbers(request, pk):
                             'error': f'Cannot change question number for "{qi.item.name}" as it is referenced in the construct scale equation "{ref_check["equation"]}" for scale "{ref_check["construct_name"]}". Please update the equation first.'
                         })
         
+        # Validate the items that are to be removed
+        items_to_remove = []
+        for item_id in removed_items:
+            if item_id in item_map:
+                qi = item_map[item_id]
+                items_to_remove.append(qi.id)
+                # Check if there are any rules depending on this item
+                dependent_rules = rules_by_dependent_item[qi.id]
+                if dependent_rules:
+                    rule_details = []
+                    for rule in dependent_rules:
+                        rule_details.append(
+                            f"- Question '{rule.questionnaire_item.item.name}' depends on this question"
+                        )
+                    return JsonResponse({
+                        'success': False,
+                        'error': f'Cannot remove question "{qi.item.name}" as it is referenced by the following rules:\n' + '\n'.join(rule_details)
+                    })
+                # Check if this item has any rules
+                item_rules = rules_by_item[qi.id]
+                if item_rules:
+                    rule_details = []
+                    for rule in item_rules:
+                        rule_details.append(
+                            f"- Rule based on question '{rule.dependent_item.item.name}'"
+                        )
+                    return JsonResponse({
+                        'success': False,
+                        'error': f'Cannot remove question "{qi.item.name}" as it has the following rules:\n' + '\n'.join(rule_details)
+                    })
+                
+                # Check if this item is referenced in any construct scale equations
+                ref_check = qi.item.is_referenced_in_equation()
+                if ref_check['is_referenced']:
+                    return JsonResponse({
+                        'success': False,
+                        'error': f'Cannot remove question "{qi.item.name}" as it is referenced in the construct scale equation "{ref_check["equation"]}" for scale "{ref_check["construct_name"]}". Please update the equation first.'
+                    })
+        
         # Second pass: Apply all changes
         with transaction.atomic():
-            # Update question numbers for remaining items
-            for item_id, new_number in question_numbers.items():
+            # Work out the final numbering of the whole questionnaire before writing anything
+            final_numbers = {qi.id: qi.question_number for qi in item_map.values()}
+            items_to_update = []
+            for item_id, new_number in question_numbers:
                 if item_id in item_map:
                     qi = item_map[item_id]
                     if qi.question_number != new_number:
-                        qi.question_number = new_number
-                        qi.save()
+                        final_numbers[qi.id] = new_number
+                        items_to_update.append(qi)
             
-            # Remove items that are no longer in the list
-            for item_id in removed_items:
-                if item_id in item_map:
-                    qi = item_map[item_id]
-                    # Check if there are any rules depending on this item
-                    dependent_rules = QuestionnaireItemRule.objects.filter(
-                        dependent_item=qi
+            # bulk_update bypasses the pre_save rule validation, so check every rule touching a
+            # renumbered question against the final numbering: a dependent question must still
+            # come before the question whose rule depends on it
+            invalid_rules = {}
+            for qi in items_to_update:
+                for rule in rules_by_item[qi.id] + rules_by_dependent_item[qi.id]:
+                    dependent_number = final_numbers.get(rule.dependent_item_id, rule.dependent_item.question_number)
+                    item_number = final_numbers.get(rule.questionnaire_item_id, rule.questionnaire_item.question_number)
+                    if dependent_number >= item_number:
+                        invalid_rules[rule.id] = rule
+            if invalid_rules:
+                rule_details = []
+                for rule in invalid_rules.values():
+                    rule_details.append(
+                        f"- Rule for question '{rule.questionnaire_item.item.name}' "
+                        f"based on question '{rule.dependent_item.item.name}'"
                     )
-                    if dependent_rules.exists():
-                        rule_details = []
-                        for rule in dependent_rules:
-                            rule_details.append(
-                                f"- Question '{rule.questionnaire_item.item.name}' depends on this question"
-                            )
-                        return JsonResponse({
-                            'success': False,
-                            'error': f'Cannot remove question "{qi.item.name}" as it is referenced by the following rules:\n' + '\n'.join(rule_details)
-                        })
-                    # Check if this item has any rules
-                    item_rules = QuestionnaireItemRule.objects.filter(
-                        questionnaire_item=qi
-                    )
-                    if item_rules.exists():
-                        rule_details = []
-                        for rule in item_rules:
-                            rule_details.append(
-                                f"- Rule based on question '{rule.dependent_item.item.name}'"
-                            )
-                        return JsonResponse({
-                            'success': False,
-                            'error': f'Cannot remove question "{qi.item.name}" as it has the following rules:\n' + '\n'.join(rule_details)
-                        })
-                    
-                    # Check if this item is referenced in any construct scale equations
-                    ref_check = qi.item.is_referenced_in_equation()
-                    if ref_check['is_referenced']:
-                        return JsonResponse({
-                            'success': False,
-                            'error': f'Cannot remove question "{qi.item.name}" as it is referenced in the construct scale equation "{ref_check["equation"]}" for scale "{ref_check["construct_name"]}". Please update the equation first.'
-                        })
+                return JsonResponse({
+                    'success': False,
+                    'error': 'Cannot save the new question order as it would invalidate the following rules:\n' + '\n'.join(rule_details)
+                })
+            
+            # Update question numbers for remaining items in a single query
+            now = timezone.now()
+            for qi in items_to_update:
+                qi.question_number = final_numbers[qi.id]
+                qi.modified_date = now
+            if items_to_update:
+                QuestionnaireItem.objects.bulk_update(items_to_update, ['question_number', 'modified_date'])
+            
+            # Remove items that are no longer in the list
+            if items_to_remove:
+                QuestionnaireItem.objects.filter(pk__in=items_to_remove).delete()
         
-        return JsonResponse({
+        return _json_response({
             'success': True,
             'message': 'Question numbers updated successfully. All changes have been saved.'
         })
@@ -2672,23 +2897,27 @@ class QuestionnaireRulesView(LoginRequiredMixin, PermissionRequiredMixin, Detail
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        questionnaire = self.get_object()
+        questionnaire = self.object
         
-        # Prefetch rules and rule groups for all questionnaire items
+        # Prefetch rules and rule groups for all questionnaire items, together with
+        # the related objects the template displays for each item and rule
+        rules_queryset = QuestionnaireItemRule.objects.select_related('dependent_item')
         raw_items = QuestionnaireItem.objects.filter(
             questionnaire=questionnaire
+        ).select_related(
+            'item', 'item__likert_response', 'item__range_response'
         ).order_by('question_number').prefetch_related(
-            Prefetch('visibility_rules', queryset=QuestionnaireItemRule.objects.order_by('rule_order')),
-            Prefetch('rule_groups', queryset=QuestionnaireItemRuleGroup.objects.order_by('group_order').prefetch_related('rules'))
+            Prefetch('visibility_rules', queryset=rules_queryset.order_by('rule_order')),
+            Prefetch('rule_groups', queryset=QuestionnaireItemRuleGroup.objects.order_by('group_order').prefetch_related(
+                Prefetch('rules', queryset=rules_queryset)
+            ))
         )
         
         questionnaire_items_structured = []
         for item in raw_items:
             rules = list(item.visibility_rules.all())
             groups = list(item.rule_groups.all())
-            grouped_rule_ids = set()
-            for group in groups:
-                grouped_rule_ids.update(r.id for r in group.rules.all())
+            grouped_rule_ids = {r.id for group in groups for r in group.rules.all()}
             ungrouped_rules = [r for r in rules if r.id not in grouped_rule_ids]
             questionnaire_items_structured.append({
                 'item': item,
@@ -2699,6 +2928,80 @@ class QuestionnaireRulesView(LoginRequiredMixin, PermissionRequiredMixin, Detail
         context['questionnaire_items_structured'] = questionnaire_items_structured
         return context
 
+# Comparison functions for each QuestionnaireItemRule operator
+_RULE_OPERATORS = {
+    'EQUALS': operator.eq,
+    'NOT_EQUALS': operator.ne,
+    'GREATER_THAN': operator.gt,
+    'LESS_THAN': operator.lt,
+    'GREATER_THAN_EQUALS': operator.ge,
+    'LESS_THAN_EQUALS': operator.le,
+    'CONTAINS': lambda value, comparison: str(comparison) in str(value),
+    'NOT_CONTAINS': lambda value, comparison: str(comparison) not in str(value),
+}
+
+_NUMERIC_RESPONSE_TYPES = frozenset(['Number', 'Likert', 'Range'])
+
+@functools.lru_cache(maxsize=1024)
+def _coerce_comparison_value(value, is_numeric):
+    """Convert a rule's comparison value for comparison. The same values recur across rules, so results are memoized."""
+    return float(value) if is_numeric else str(value)
+
+def _evaluate_rule(rule, responses, logger, log_prefix='', coerced_responses=None):
+    """
+    Evaluate a single visibility rule against the submitted responses.
+    Returns the boolean result, or None if the rule could not be evaluated.
+    coerced_responses, if given, caches the converted response of each dependent item
+    across the rules evaluated in one request.
+    """
+    dependent_item_id = rule.dependent_item_id
+    dependent_response = responses.get(str(dependent_item_id))
+    logger.info(f"{log_prefix}Evaluating rule: Dependent Q{rule.dependent_item.question_number}, Operator: {rule.operator}, Comparison: {rule.comparison_value}, User Response: {dependent_response}")
+    if dependent_response is None:
+        logger.info(f"{log_prefix}No response for dependent item {dependent_item_id}. Skipping rule.")
+        return None
+    
+    try:
+        is_numeric = rule.dependent_item.item.response_type in _NUMERIC_RESPONSE_TYPES
+        cache_key = (dependent_item_id, is_numeric)
+        if coerced_responses is not None and cache_key in coerced_responses:
+            dependent_value = coerced_responses[cache_key]
+        else:
+            dependent_value = float(dependent_response) if is_numeric else str(dependent_response)
+            if coerced_responses is not None:
+                coerced_responses[cache_key] = dependent_value
+        comparison_value = _coerce_comparison_value(rule.comparison_value, is_numeric)
+        
+        compare = _RULE_OPERATORS.get(rule.operator)
+        result = compare(dependent_value, comparison_value) if compare else False
+    except (ValueError, TypeError) as e:
+        logger.warning(f"{log_prefix}Error evaluating rule: {e}")
+        return None
+    
+    logger.info(f"{log_prefix}Rule result: {result}")
+    return result
+
+def _remaining_logical_operators(rules):
+    """
+    For each rule position, return the logical operator shared by all rules after it
+    ('AND' or 'OR'), None if they are mixed, or 'ANY' if no rules follow.
+    """
+    remaining = [None] * len(rules)
+    shared = 'ANY'
+    for i in range(len(rules) - 1, -1, -1):
+        remaining[i] = shared
+        logical_operator = 'AND' if rules[i].logical_operator == 'AND' else 'OR'
+        shared = logical_operator if shared in ('ANY', logical_operator) else None
+    return remaining
+
+def _is_rule_result_decided(current_result, remaining_operator):
+    """Return True if the rules still to be combined cannot change current_result."""
+    if remaining_operator == 'ANY':
+        return True
+    if current_result:
+        return remaining_operator == 'OR'
+    return remaining_operator == 'AND'
+
 def evaluate_question_rules(request, questionnaire_item_id):
     """
     View to evaluate rules for a questionnaire item.
@@ -2707,132 +3010,195 @@ def evaluate_question_rules(request, questionnaire_item_id):
     logger = logging.getLogger("promapp.rules")
     try:
         questionnaire_item = get_object_or_404(QuestionnaireItem, pk=questionnaire_item_id)
-        responses = json.loads(request.body)
+        responses = _load_json_body(request)
         logger.info(f"Evaluating rules for QuestionnaireItem {questionnaire_item_id} with responses: {responses}")
         
-        # Get all rules and rule groups for this item
-        rules = questionnaire_item.visibility_rules.all()
-        rule_groups = questionnaire_item.rule_groups.all()
+        # Get all rules and rule groups for this item, with the dependent items loaded
+        # up front so evaluating each rule does not hit the database
+        rules = list(questionnaire_item.visibility_rules.select_related('dependent_item__item'))
+        rule_groups = list(questionnaire_item.rule_groups.prefetch_related(
+            Prefetch('rules', queryset=QuestionnaireItemRule.objects.select_related('dependent_item__item'))
+        ))
         
         # If no rules or groups, always show the question
         if not rules and not rule_groups:
             logger.info(f"No rules or rule groups for QuestionnaireItem {questionnaire_item_id}. Showing question.")
-            return JsonResponse({'should_show': True})
-        
-        # Evaluate individual rules
-        rule_results = []
-        for rule in rules:
-            dependent_response = responses.get(str(rule.dependent_item.id))
-            logger.info(f"Evaluating rule: Dependent Q{rule.dependent_item.question_number}, Operator: {rule.operator}, Comparison: {rule.comparison_value}, User Response: {dependent_response}")
-            if dependent_response is None:
-                logger.info(f"No response for dependent item {rule.dependent_item.id}. Skipping rule.")
-                continue
-            
-            try:
-                if rule.dependent_item.item.response_type in ['Number', 'Likert', 'Range']:
-                    dependent_value = float(dependent_response)
-                    comparison_value = float(rule.comparison_value)
-                else:
-                    dependent_value = str(dependent_response)
-                    comparison_value = str(rule.comparison_value)
-                
-                result = False
-                if rule.operator == 'EQUALS':
-                    result = dependent_value == comparison_value
-                elif rule.operator == 'NOT_EQUALS':
-                    result = dependent_value != comparison_value
-                elif rule.operator == 'GREATER_THAN':
-                    result = dependent_value > comparison_value
-                elif rule.operator == 'LESS_THAN':
-                    result = dependent_value < comparison_value
-                elif rule.operator == 'GREATER_THAN_EQUALS':
-                    result = dependent_value >= comparison_value
-                elif rule.operator == 'LESS_THAN_EQUALS':
-                    result = dependent_value <= comparison_value
-                elif rule.operator == 'CONTAINS':
-                    result = str(comparison_value) in str(dependent_value)
-                elif rule.operator == 'NOT_CONTAINS':
-                    result = str(comparison_value) not in str(dependent_value)
-                logger.info(f"Rule result: {result}")
-                rule_results.append((result, rule.logical_operator))
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Error evaluating rule: {e}")
-                continue
-        
-        # Evaluate rule groups
-        group_results = []
-        for group in rule_groups:
-            group_rules = group.rules.all()
-            if not group_rules:
-                continue
-            group_result = True
-            for i, rule in enumerate(group_rules):
-                dependent_response = responses.get(str(rule.dependent_item.id))
-                logger.info(f"[Group {group.group_order}] Evaluating rule: Dependent Q{rule.dependent_item.question_number}, Operator: {rule.operator}, Comparison: {rule.comparison_value}, User Response: {dependent_response}")
-                if dependent_response is None:
-                    logger.info(f"[Group {group.group_order}] No response for dependent item {rule.dependent_item.id}. Skipping rule.")
-                    continue
-                try:
-                    if rule.dependent_item.item.response_type in ['Number', 'Likert', 'Range']:
-                        dependent_value = float(dependent_response)
-                        comparison_value = float(rule.comparison_value)
-                    else:
-                        dependent_value = str(dependent_response)
-                        comparison_value = str(rule.comparison_value)
-                    result = False
-                    if rule.operator == 'EQUALS':
-                        result = dependent_value == comparison_value
-                    elif rule.operator == 'NOT_EQUALS':
-                        result = dependent_value != comparison_value
-                    elif rule.operator == 'GREATER_THAN':
-                        result = dependent_value > comparison_value
-                    elif rule.operator == 'LESS_THAN':
-                        result = dependent_value < comparison_value
-                    elif rule.operator == 'GREATER_THAN_EQUALS':
-                        result = dependent_value >= comparison_value
-                    elif rule.operator == 'LESS_THAN_EQUALS':
-                        result = dependent_value <= comparison_value
-                    elif rule.operator == 'CONTAINS':
-                        result = str(comparison_value) in str(dependent_value)
-                    elif rule.operator == 'NOT_CONTAINS':
-                        result = str(comparison_value) not in str(dependent_value)
-                    logger.info(f"[Group {group.group_order}] Rule result: {result}")
-                    if i > 0:
-                        if rule.logical_operator == 'AND':
-                            group_result = group_result and result
-                        else:  # OR
-                            group_result = group_result or result
-                    else:
-                        group_result = result
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"[Group {group.group_order}] Error evaluating rule: {e}")
-                    continue
-            group_results.append(group_result)
+            return _json_response({'should_show': True})
+        
+        # Converted responses, shared by every rule that depends on the same item
+        coerced_responses = {}
+        
+        # Evaluate individual rules left to right, stopping as soon as the remaining
+        # rules can no longer change the combined result
+        rules_result = None
+        remaining_operators = _remaining_logical_operators(rules)
+        for i, rule in enumerate(rules):
+            result = _evaluate_rule(rule, responses, logger, coerced_responses=coerced_responses)
+            if result is not None:
+                if rules_result is None:
+                    rules_result = result
+                elif rule.logical_operator == 'AND':
+                    rules_result = rules_result and result
+                else:  # OR
+                    rules_result = rules_result or result
+            if rules_result is not None and _is_rule_result_decided(rules_result, remaining_operators[i]):
+                break
         
-        # Combine all results
         should_show = True
-        if rule_results:
-            current_result = rule_results[0][0]
-            for i in range(1, len(rule_results)):
-                result, operator = rule_results[i]
-                if operator == 'AND':
-                    current_result = current_result and result
-                else:  # OR
-                    current_result = current_result or result
-            should_show = should_show and current_result
-        if group_results:
-            group_result = group_results[0]
-            for result in group_results[1:]:
-                group_result = group_result or result
-            should_show = should_show and group_result
+        if rules_result is not None:
+            should_show = rules_result
+        
+        # Evaluate rule groups. Groups are OR-combined, so stop at the first group that
+        # passes, and skip them entirely if the individual rules already hide the question.
+        if should_show:
+            groups_result = None
+            for group in rule_groups:
+                group_rules = list(group.rules.all())
+                if not group_rules:
+                    continue
+                group_result = True
+                log_prefix = f"[Group {group.group_order}] "
+                remaining_operators = _remaining_logical_operators(group_rules)
+                for i, rule in enumerate(group_rules):
+                    result = _evaluate_rule(rule, responses, logger, log_prefix, coerced_responses)
+                    if result is not None:
+                        if i > 0:
+                            if rule.logical_operator == 'AND':
+                                group_result = group_result and result
+                            else:  # OR
+                                group_result = group_result or result
+                        else:
+                            group_result = result
+                    if _is_rule_result_decided(group_result, remaining_operators[i]):
+                        break
+                groups_result = group_result
+                if groups_result:
+                    break
+            if groups_result is not None:
+                should_show = groups_result
         logger.info(f"Final should_show for QuestionnaireItem {questionnaire_item_id}: {should_show}")
-        return JsonResponse({'should_show': should_show})
+        return _json_response({'should_show': should_show})
     except Exception as e:
         logger.error(f"Error in evaluate_question_rules: {e}")
         return JsonResponse({'error': 'Unable to evaluate question rules. Please check your form data and try again.'}, status=400)
 
 # Translation Views
-class ItemTranslationView(LoginRequiredMixin, PermissionRequiredMixin, UpdateView):
+class _CachedObjectMixin:
+    """
+    Fetch the view's object once per request. UpdateView's get/post, get_form_kwargs,
+    get_context_data and form_valid all call get_object().
+    """
+    def get_object(self, queryset=None):
+        if queryset is not None:
+            return super().get_object(queryset)
+        if not hasattr(self, '_object'):
+            self._object = super().get_object()
+        return self._object
+
+class _TranslationContextMixin:
+    """
+    Adds the available languages and the language being translated (the ?language=
+    parameter, defaulting to settings.LANGUAGE_CODE) to the context.
+    """
+    def get_translation_language(self):
+        return self.request.GET.get('language', settings.LANGUAGE_CODE)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['available_languages'] = settings.LANGUAGES
+        context['current_language'] = self.get_translation_language()
+        return context
+
+class _TranslationObjectMixin(_CachedObjectMixin, _TranslationContextMixin):
+    """
+    Loads the translatable object together with its translations in the languages the
+    translation views need (the language being edited, the active language and its
+    fallbacks), so the per-language lookups do not query again.
+    """
+    def get_queryset(self):
+        active_language = get_language()
+        languages = {
+            self.get_translation_language(),
+            active_language,
+            settings.LANGUAGE_CODE,
+            *parler_appsettings.PARLER_LANGUAGES.get_fallback_languages(active_language),
+        }
+        translation_model = self.model._parler_meta.root_model
+        queryset = super().get_queryset().prefetch_related(
+            Prefetch('translations', queryset=translation_model.objects.filter(language_code__in=languages))
+        )
+        if self.request.method in ('GET', 'HEAD'):
+            # Rendering the form only reads translated fields. Saving validates and
+            # writes the whole row, so POST still loads every column.
+            queryset = queryset.only('pk')
+        return queryset
+
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        if self.request.method not in ('GET', 'HEAD'):
+            # A bound TranslatableModelForm writes the posted values onto its instance's
+            # active-language translation while cleaning. Give it its own copy, so the cached
+            # object that form_valid switches to the edited language saves only that language.
+            kwargs['instance'] = self.get_object(self.get_queryset())
+        return kwargs
+
+    def get_translation(self, obj, language_code):
+        """Return the translation of obj in language_code, raising DoesNotExist if there is none."""
+        for obj_translation in obj.translations.all():
+            if obj_translation.language_code == language_code:
+                return obj_translation
+        raise obj.translations.model.DoesNotExist
+
+    def save_translation(self, obj):
+        """
+        Save only the translated fields of obj. The master row is left alone apart from
+        its modified_date, which is bumped with a single UPDATE instead of a full save().
+        """
+        obj.save_translations()
+        type(obj).objects.filter(pk=obj.pk).update(modified_date=timezone.now())
+
+@functools.lru_cache(maxsize=None)
+def _translation_search_url(url_name):
+    """reverse() for the translation list search targets; the URLs never change at runtime."""
+    return reverse(url_name)
+
+class _TranslationListMixin(_TranslationContextMixin):
+    """
+    Shared context for the translation list views: the search form wired up for HTMX
+    to search_url_name and the current filter values.
+    """
+    search_url_name = None
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        current_search = self.request.GET.get('search', '')
+        current_language_filter = self.request.GET.get('language_filter', '')
+        
+        is_htmx = bool(self.request.htmx)
+        search_url = _translation_search_url(self.search_url_name)
+        
+        # HTMX requests only re-render the table partial, so the search form is only
+        # built for full page loads
+        if not is_htmx:
+            # Create form with current values
+            context['search_form'] = TranslationSearchForm(initial={
+                'search': current_search,
+                'language_filter': current_language_filter
+            })
+            
+            # Set up HTMX attributes for both fields
+            context['search_form'].fields['search'].widget.attrs['hx-get'] = search_url
+            context['search_form'].fields['language_filter'].widget.attrs['hx-get'] = search_url
+        
+        # Add current filter values for form state preservation
+        context['search_url'] = search_url
+        context['current_search'] = current_search
+        context['current_language_filter'] = current_language_filter
+        
+        context['is_htmx'] = is_htmx
+        return context
+
+class ItemTranslationView(LoginRequiredMixin, PermissionRequiredMixin, _TranslationObjectMixin, UpdateView):
     """
     View for managing translations of an Item.
     """
@@ -2843,8 +3209,6 @@ class ItemTranslationView(LoginRequiredMixin, PermissionRequiredMixin, UpdateVie
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['available_languages'] = settings.LANGUAGES
-        context['current_language'] = self.request.GET.get('language', settings.LANGUAGE_CODE)
         item = self.get_object()
         context['original_name'] = item.name
         context['original_media'] = item.media
@@ -2852,10 +3216,10 @@ class ItemTranslationView(LoginRequiredMixin, PermissionRequiredMixin, UpdateVie
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
-        current_language = self.request.GET.get('language', settings.LANGUAGE_CODE)
+        current_language = self.get_translation_language()
         item = self.get_object()
         try:
-            translation = item.translations.get(language_code=current_language)
+            translation = self.get_translation(item, current_language)
             kwargs['initial'] = {
                 'name': translation.name,
                 'media': translation.media
@@ -2868,7 +3232,7 @@ class ItemTranslationView(LoginRequiredMixin, PermissionRequiredMixin, UpdateVie
         return kwargs
 
     def form_valid(self, form):
-        current_language = self.request.GET.get('language', settings.LANGUAGE_CODE)
+        current_language = self.get_translation_language()
         item = self.get_object()
         item.set_current_language(current_language)
         item.name = form.cleaned_data['name']
@@ -2880,7 +3244,7 @@ class ItemTranslationView(LoginRequiredMixin, PermissionRequiredMixin, UpdateVie
     def get_success_url(self):
         return reverse('item_list')
 
-class ItemTranslationListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
+class ItemTranslationListView(LoginRequiredMixin, PermissionRequiredMixin, _TranslationListMixin, ListView):
     """
     View for listing items with translation links.
     """
@@ -2888,108 +3252,70 @@ class ItemTranslationListView(LoginRequiredMixin, PermissionRequiredMixin, ListV
     template_name = 'promapp/item_translation_list.html'
     context_object_name = 'items'
     permission_required = 'promapp.add_item'
+    search_url_name = 'item_translation_list'
+    paginate_by = 25
 
     def get_queryset(self):
-        # Get all items with their translations in the default language
+        # Get all items with their translations in the default language. Translation
+        # filters use EXISTS subqueries so the translations table is never joined and
+        # no DISTINCT is needed to remove duplicate rows.
         queryset = Item.objects.all()
+        item_translations = Item._parler_meta.root_model.objects.filter(master=OuterRef('pk'))
         
-        # Apply search filter if provided
-        search = self.request.GET.get('search')
+        # Apply search filter if provided (blank searches are skipped)
+        search = self.request.GET.get('search', '').strip()
         if search:
-            queryset = queryset.filter(translations__name__icontains=search)
+            queryset = queryset.filter(
+                Exists(item_translations.filter(name__icontains=search))
+            )
         
         # Apply language filter if provided
         language_filter = self.request.GET.get('language_filter')
         if language_filter:
+            has_content = (
+                (Q(name__isnull=False) & ~Q(name='')) |
+                (Q(media__isnull=False) & ~Q(media=''))
+            )
             if language_filter.endswith('_translated'):
-                # Filter for items that have translation in the specified language
+                # Filter for items that have translation with content in the specified language
                 lang_code = language_filter.replace('_translated', '')
                 queryset = queryset.filter(
-                    translations__language_code=lang_code
-                ).annotate(
-                    has_content=models.Case(
-                        models.When(
-                            models.Q(translations__name__isnull=False) & 
-                            ~models.Q(translations__name='') |
-                            models.Q(translations__media__isnull=False) & 
-                            ~models.Q(translations__media=''),
-                            then=models.Value(True)
-                        ),
-                        default=models.Value(False),
-                        output_field=models.BooleanField()
-                    )
-                ).filter(has_content=True)
+                    Exists(item_translations.filter(has_content, language_code=lang_code))
+                )
             elif language_filter.endswith('_untranslated'):
-                # Filter for items that don't have translation in the specified language
+                # Filter for items that either don't have translation or have empty translation
                 lang_code = language_filter.replace('_untranslated', '')
-                # Get items that either don't have translation or have empty translation
-                translated_item_ids = Item.objects.filter(
-                    translations__language_code=lang_code,
-                    translations__name__isnull=False,
-                ).exclude(
-                    translations__name=''
-                ).values_list('id', flat=True)
-                
-                translated_media_item_ids = Item.objects.filter(
-                    translations__language_code=lang_code,
-                    translations__media__isnull=False,
-                ).exclude(
-                    translations__media=''
-                ).values_list('id', flat=True)
-                
-                # Combine both lists to get all translated items
-                all_translated_ids = set(list(translated_item_ids) + list(translated_media_item_ids))
-                
-                queryset = queryset.exclude(id__in=all_translated_ids)
+                queryset = queryset.exclude(
+                    Exists(item_translations.filter(has_content, language_code=lang_code))
+                )
             
         # Prefetch translations for better performance
         queryset = queryset.prefetch_related('translations')
         
-        return queryset.distinct().order_by('id')
+        return queryset.order_by('id')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['available_languages'] = settings.LANGUAGES
-        context['current_language'] = self.request.GET.get('language', settings.LANGUAGE_CODE)
-        
-        # Create form with current values
-        form_initial = {
-            'search': self.request.GET.get('search', ''),
-            'language_filter': self.request.GET.get('language_filter', '')
-        }
-        context['search_form'] = TranslationSearchForm(initial=form_initial)
-        
-        # Set up HTMX attributes for both fields
-        context['search_form'].fields['search'].widget.attrs['hx-get'] = reverse('item_translation_list')
-        context['search_form'].fields['language_filter'].widget.attrs['hx-get'] = reverse('item_translation_list')
-        
-        # Add current filter values for form state preservation
-        context['current_search'] = self.request.GET.get('search', '')
-        context['current_language_filter'] = self.request.GET.get('language_filter', '')
-        
-        context['is_htmx'] = bool(self.request.META.get('HTTP_HX_REQUEST'))
         
         # Add translation status data for each item
         items_with_translation_status = []
         for item in context['items']:
             # Get all existing translations for this item
-            existing_translations = set(
-                item.translations.values_list('language_code', flat=True)
-            )
+            existing_translations = {
+                item_translation.language_code: item_translation
+                for item_translation in item.translations.all()
+            }
             
             translation_status = []
             for lang_code, lang_name in settings.LANGUAGES:
                 has_translation = lang_code in existing_translations
                 # Check if translation has content (not just empty strings)
                 if has_translation:
-                    try:
-                        translation = item.translations.get(language_code=lang_code)
-                        has_content = bool(
-                            (translation.name and translation.name.strip()) or 
-                            (translation.media and str(translation.media).strip())
-                        )
-                    except item.translations.model.DoesNotExist:
-                        has_content = False
+                    translation = existing_translations[lang_code]
+                    has_content = bool(
+                        (translation.name and translation.name.strip()) or 
+                        (translation.media and str(translation.media).strip())
+                    )
                 else:
                     has_content = False
                     
@@ -3010,17 +3336,16 @@ class ItemTranslationListView(LoginRequiredMixin, PermissionRequiredMixin, ListV
     
     def get(self, request, *args, **kwargs):
         # Check if this is an HTMX request
-        if request.META.get('HTTP_HX_REQUEST'):
+        if request.htmx:
             # If it is an HTMX request, only return the table part
             self.object_list = self.get_queryset()
             context = self.get_context_data()
-            html = render_to_string('promapp/partials/item_translation_list_table.html', context)
-            return HttpResponse(html)
+            return TemplateResponse(request, 'promapp/partials/item_translation_list_table.html', context)
         
         # Otherwise, return the full page as usual
         return super().get(request, *args, **kwargs)
 
-class QuestionnaireTranslationView(LoginRequiredMixin, PermissionRequiredMixin, UpdateView):
+class QuestionnaireTranslationView(LoginRequiredMixin, PermissionRequiredMixin, _TranslationObjectMixin, UpdateView):
     """
     View for managing translations of a Questionnaire.
     """
@@ -3031,8 +3356,6 @@ class QuestionnaireTranslationView(LoginRequiredMixin, PermissionRequiredMixin,
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['available_languages'] = settings.LANGUAGES
-        context['current_language'] = self.request.GET.get('language', settings.LANGUAGE_CODE)
         
         # Get the questionnaire instance
         questionnaire = self.get_object()
@@ -3045,14 +3368,14 @@ class QuestionnaireTranslationView(LoginRequiredMixin, PermissionRequiredMixin,
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
-        current_language = self.request.GET.get('language', settings.LANGUAGE_CODE)
+        current_language = self.get_translation_language()
         
         # Get the questionnaire instance
         questionnaire = self.get_object()
         
         # Try to get existing translation
         try:
-            translation = questionnaire.translations.get(language_code=current_language)
+            translation = self.get_translation(questionnaire, current_language)
             # If translation exists, use its values
             kwargs['initial'] = {
                 'name': translation.name,
@@ -3069,20 +3392,20 @@ class QuestionnaireTranslationView(LoginRequiredMixin, PermissionRequiredMixin,
 
     def form_valid(self, form):
         # Get the current language from the request
-        current_language = self.request.GET.get('language', settings.LANGUAGE_CODE)
+        current_language = self.get_translation_language()
         questionnaire = self.get_object()
         questionnaire.set_current_language(current_language)
         # Set translated fields
         questionnaire.name = form.cleaned_data['name']
         questionnaire.description = form.cleaned_data['description']
-        questionnaire.save()  # This saves the translation for the current language only
+        self.save_translation(questionnaire)
         messages.success(self.request, _('Translation saved successfully.'))
         return redirect(self.get_success_url())
 
     def get_success_url(self):
         return reverse('questionnaire_translation_list')
 
-class QuestionnaireTranslationListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
+class QuestionnaireTranslationListView(LoginRequiredMixin, PermissionRequiredMixin, _TranslationListMixin, ListView):
     """
     View for listing questionnaires with translation links.
     """
@@ -3090,94 +3413,62 @@ class QuestionnaireTranslationListView(LoginRequiredMixin, PermissionRequiredMix
     template_name = 'promapp/questionnaire_translation_list.html'
     context_object_name = 'questionnaires'
     permission_required = 'promapp.add_questionnaire'
+    search_url_name = 'questionnaire_translation_list'
+    paginate_by = 25
 
     def get_queryset(self):
-        # Get all questionnaires with their translations
-        queryset = Questionnaire.objects.all()
+        # Get all questionnaires, sorted by their name in the default language. Translation
+        # filters use EXISTS subqueries so no DISTINCT is needed to remove duplicate rows.
+        questionnaire_translations = Questionnaire._parler_meta.root_model.objects.filter(master=OuterRef('pk'))
+        queryset = Questionnaire.objects.annotate(
+            display_name=Subquery(
+                questionnaire_translations.filter(language_code=settings.LANGUAGE_CODE).values('name')[:1]
+            )
+        )
         
-        # Apply search filter if provided
-        search = self.request.GET.get('search')
+        # Apply search filter if provided (blank searches are skipped)
+        search = self.request.GET.get('search', '').strip()
         if search:
-            queryset = queryset.filter(translations__name__icontains=search)
+            queryset = queryset.filter(
+                Exists(questionnaire_translations.filter(name__icontains=search))
+            )
         
         # Apply language filter if provided
         language_filter = self.request.GET.get('language_filter')
         if language_filter:
+            has_content = (
+                (Q(name__isnull=False) & ~Q(name='')) |
+                (Q(description__isnull=False) & ~Q(description=''))
+            )
             if language_filter.endswith('_translated'):
-                # Filter for questionnaires that have translation in the specified language
+                # Filter for questionnaires that have translation with content in the specified language
                 lang_code = language_filter.replace('_translated', '')
                 queryset = queryset.filter(
-                    translations__language_code=lang_code
-                ).annotate(
-                    has_content=models.Case(
-                        models.When(
-                            models.Q(translations__name__isnull=False) & 
-                            ~models.Q(translations__name='') |
-                            models.Q(translations__description__isnull=False) & 
-                            ~models.Q(translations__description=''),
-                            then=models.Value(True)
-                        ),
-                        default=models.Value(False),
-                        output_field=models.BooleanField()
-                    )
-                ).filter(has_content=True)
+                    Exists(questionnaire_translations.filter(has_content, language_code=lang_code))
+                )
             elif language_filter.endswith('_untranslated'):
-                # Filter for questionnaires that don't have translation in the specified language
+                # Filter for questionnaires that either don't have translation or have empty translation
                 lang_code = language_filter.replace('_untranslated', '')
-                # Get questionnaires that have meaningful translation content
-                translated_name_ids = Questionnaire.objects.filter(
-                    translations__language_code=lang_code,
-                    translations__name__isnull=False,
-                ).exclude(
-                    translations__name=''
-                ).values_list('id', flat=True)
-                
-                translated_desc_ids = Questionnaire.objects.filter(
-                    translations__language_code=lang_code,
-                    translations__description__isnull=False,
-                ).exclude(
-                    translations__description=''
-                ).values_list('id', flat=True)
-                
-                # Combine both lists to get all translated questionnaires
-                all_translated_ids = set(list(translated_name_ids) + list(translated_desc_ids))
-                
-                queryset = queryset.exclude(id__in=all_translated_ids)
+                queryset = queryset.exclude(
+                    Exists(questionnaire_translations.filter(has_content, language_code=lang_code))
+                )
             
         # Prefetch translations for better performance
         queryset = queryset.prefetch_related('translations')
         
-        return queryset.distinct().order_by('id')
+        return queryset.order_by('display_name', 'id')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['available_languages'] = settings.LANGUAGES
-        context['current_language'] = self.request.GET.get('language', settings.LANGUAGE_CODE)
-        
-        # Create form with current values
-        form_initial = {
-            'search': self.request.GET.get('search', ''),
-            'language_filter': self.request.GET.get('language_filter', '')
-        }
-        context['search_form'] = TranslationSearchForm(initial=form_initial)
-        
-        # Set up HTMX attributes for both fields
-        context['search_form'].fields['search'].widget.attrs['hx-get'] = reverse('questionnaire_translation_list')
-        context['search_form'].fields['language_filter'].widget.attrs['hx-get'] = reverse('questionnaire_translation_list')
-        
-        # Add current filter values for form state preservation
-        context['current_search'] = self.request.GET.get('search', '')
-        context['current_language_filter'] = self.request.GET.get('language_filter', '')
-        
-        context['is_htmx'] = bool(self.request.META.get('HTTP_HX_REQUEST'))
         
         # Add translation status data for each questionnaire
         questionnaires_with_translation_status = []
         for questionnaire in context['questionnaires']:
             # Get all existing translations for this questionnaire
-            existing_translations = set(
-                questionnaire.translations.values_list('language_code', flat=True)
-            )
+            existing_translations = {
+                questionnaire_translation.language_code: questionnaire_translation
+                for questionnaire_translation in questionnaire.translations.all()
+            }
             
             translation_status = []
             available_translations = []
@@ -3187,14 +3478,11 @@ class QuestionnaireTranslationListView(LoginRequiredMixin, PermissionRequiredMix
                 has_translation = lang_code in existing_translations
                 # Check if translation has content (not just empty strings)
                 if has_translation:
-                    try:
-                        translation = questionnaire.translations.get(language_code=lang_code)
-                        has_content = bool(
-                            (translation.name and translation.name.strip()) or 
-                            (translation.description and translation.description.strip())
-                        )
-                    except questionnaire.translations.model.DoesNotExist:
-                        has_content = False
+                    translation = existing_translations[lang_code]
+                    has_content = bool(
+                        (translation.name and translation.name.strip()) or 
+                        (translation.description and translation.description.strip())
+                    )
                 else:
                     has_content = False
                     
@@ -3226,17 +3514,16 @@ class QuestionnaireTranslationListView(LoginRequiredMixin, PermissionRequiredMix
     
     def get(self, request, *args, **kwargs):
         # Check if this is an HTMX request
-        if request.META.get('HTTP_HX_REQUEST'):
+        if request.htmx:
             # If it is an HTMX request, only return the partial template
             self.object_list = self.get_queryset()
             context = self.get_context_data()
-            html = render_to_string('promapp/partials/questionnaire_translation_list_table.html', context)
-            return HttpResponse(html)
+            return TemplateResponse(request, 'promapp/partials/questionnaire_translation_list_table.html', context)
         
         # Otherwise, return the full page as usual
         return super().get(request, *args, **kwargs)
 
-class LikertScaleResponseOptionTranslationView(LoginRequiredMixin, PermissionRequiredMixin, UpdateView):
+class LikertScaleResponseOptionTranslationView(LoginRequiredMixin, PermissionRequiredMixin, _TranslationObjectMixin, UpdateView):
     """
     View for managing translations of a LikertScaleResponseOption.
     """
@@ -3247,8 +3534,6 @@ class LikertScaleResponseOptionTranslationView(LoginRequiredMixin, PermissionReq
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['available_languages'] = settings.LANGUAGES
-        context['current_language'] = self.request.GET.get('language', settings.LANGUAGE_CODE)
         option = self.get_object()
         context['original_option_text'] = option.option_text
         context['original_option_media'] = option.option_media
@@ -3256,10 +3541,10 @@ class LikertScaleResponseOptionTranslationView(LoginRequiredMixin, PermissionReq
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
-        current_language = self.request.GET.get('language', settings.LANGUAGE_CODE)
+        current_language = self.get_translation_language()
         option = self.get_object()
         try:
-            translation = option.translations.get(language_code=current_language)
+            translation = self.get_translation(option, current_language)
             kwargs['initial'] = {
                 'option_text': translation.option_text,
                 'option_media': translation.option_media
@@ -3272,19 +3557,19 @@ class LikertScaleResponseOptionTranslationView(LoginRequiredMixin, PermissionReq
         return kwargs
 
     def form_valid(self, form):
-        current_language = self.request.GET.get('language', settings.LANGUAGE_CODE)
+        current_language = self.get_translation_language()
         option = self.get_object()
         option.set_current_language(current_language)
         option.option_text = form.cleaned_data['option_text']
         option.option_media = form.cleaned_data['option_media']
-        option.save()
+        self.save_translation(option)
         messages.success(self.request, _('Translation saved successfully.'))
         return redirect(self.get_success_url())
 
     def get_success_url(self):
         return reverse('likert_scale_list')
     
-class LikertScaleResponseOptionTranslationListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
+class LikertScaleResponseOptionTranslationListView(LoginRequiredMixin, PermissionRequiredMixin, _TranslationListMixin, ListView):
     """
     View for listing LikertScaleResponseOptions with translation links.
     """
@@ -3292,91 +3577,65 @@ class LikertScaleResponseOptionTranslationListView(LoginRequiredMixin, Permissio
     template_name = 'promapp/likert_scale_response_option_translation_list.html'
     context_object_name = 'options'
     permission_required = 'promapp.add_likertscaleresponseoption'
+    search_url_name = 'likert_scale_response_option_translation_list'
+    paginate_by = 25
 
     def get_queryset(self):
-        queryset = LikertScaleResponseOption.objects.language(settings.LANGUAGE_CODE).distinct('id').order_by('id', 'translations__option_text')
+        # Get all options, sorted by their text in the default language. Translation
+        # filters use EXISTS subqueries so no DISTINCT is needed to remove duplicate rows.
+        option_translations = LikertScaleResponseOption._parler_meta.root_model.objects.filter(master=OuterRef('pk'))
+        queryset = LikertScaleResponseOption.objects.language(settings.LANGUAGE_CODE).annotate(
+            display_name=Subquery(
+                option_translations.filter(language_code=settings.LANGUAGE_CODE).values('option_text')[:1]
+            )
+        )
         
-        # Apply search filter if provided
-        search = self.request.GET.get('search')
+        # Apply search filter if provided (blank searches are skipped)
+        search = self.request.GET.get('search', '').strip()
         if search:
-            queryset = queryset.filter(translations__option_text__icontains=search)
+            queryset = queryset.filter(
+                Exists(option_translations.filter(option_text__icontains=search))
+            )
         
         # Apply language filter if provided
         language_filter = self.request.GET.get('language_filter')
         if language_filter:
+            has_content = Q(option_text__isnull=False) & ~Q(option_text='')
             if language_filter.endswith('_translated'):
-                # Filter for options that have translation in the specified language
+                # Filter for options that have translation with content in the specified language
                 lang_code = language_filter.replace('_translated', '')
-                queryset = LikertScaleResponseOption.objects.filter(
-                    translations__language_code=lang_code
-                ).annotate(
-                    has_content=models.Case(
-                        models.When(
-                            models.Q(translations__option_text__isnull=False) & 
-                            ~models.Q(translations__option_text=''),
-                            then=models.Value(True)
-                        ),
-                        default=models.Value(False),
-                        output_field=models.BooleanField()
-                    )
-                ).filter(has_content=True).distinct('id').order_by('id')
+                queryset = queryset.filter(
+                    Exists(option_translations.filter(has_content, language_code=lang_code))
+                )
             elif language_filter.endswith('_untranslated'):
-                # Filter for options that don't have translation in the specified language
+                # Filter for options that either don't have translation or have empty translation
                 lang_code = language_filter.replace('_untranslated', '')
-                # Get options that have meaningful translation content
-                translated_option_ids = LikertScaleResponseOption.objects.filter(
-                    translations__language_code=lang_code,
-                    translations__option_text__isnull=False,
-                ).exclude(
-                    translations__option_text=''
-                ).values_list('id', flat=True)
-                
-                queryset = LikertScaleResponseOption.objects.exclude(
-                    id__in=translated_option_ids
-                ).distinct('id').order_by('id')
+                queryset = queryset.exclude(
+                    Exists(option_translations.filter(has_content, language_code=lang_code))
+                )
             
-        return queryset
+        # Prefetch translations for the per-language status column
+        return queryset.prefetch_related('translations').order_by('display_name', 'id')
 
-    def get_context_data(self, **kwargs):   
+    def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['available_languages'] = settings.LANGUAGES
-        context['current_language'] = self.request.GET.get('language', settings.LANGUAGE_CODE)
-        
-        # Create form with current values
-        form_initial = {
-            'search': self.request.GET.get('search', ''),
-            'language_filter': self.request.GET.get('language_filter', '')
-        }
-        context['search_form'] = TranslationSearchForm(initial=form_initial)
-        
-        # Set up HTMX attributes for both fields
-        context['search_form'].fields['search'].widget.attrs['hx-get'] = reverse('likert_scale_response_option_translation_list')
-        context['search_form'].fields['language_filter'].widget.attrs['hx-get'] = reverse('likert_scale_response_option_translation_list')
-        
-        # Add current filter values for form state preservation
-        context['current_search'] = self.request.GET.get('search', '')
-        context['current_language_filter'] = self.request.GET.get('language_filter', '')
-        
-        context['is_htmx'] = bool(self.request.META.get('HTTP_HX_REQUEST'))
         
         # Add translation status data for each option
         options_with_translation_status = []
         for option in context['options']:
             # Get all existing translations for this option
-            existing_translations = set(
-                option.translations.values_list('language_code', flat=True)
-            )
+            existing_translations = {
+                option_translation.language_code: option_translation
+                for option_translation in option.translations.all()
+            }
             
             translation_status = []
             for lang_code, lang_name in settings.LANGUAGES:
                 has_translation = lang_code in existing_translations
                 # Check if translation has content (not just empty strings)
                 if has_translation:
-                    try:
-                        translation = option.translations.get(language_code=lang_code)
-                        has_content = bool(translation.option_text and translation.option_text.strip())
-                    except option.translations.model.DoesNotExist:
-                        has_content = False
+                    translation = existing_translations[lang_code]
+                    has_content = bool(translation.option_text and translation.option_text.strip())
                 else:
                     has_content = False
                     
@@ -3397,17 +3656,16 @@ class LikertScaleResponseOptionTranslationListView(LoginRequiredMixin, Permissio
 
     def get(self, request, *args, **kwargs):
         # Check if this is an HTMX request
-        if request.META.get('HTTP_HX_REQUEST'):
+        if request.htmx:
             # If it is an HTMX request, only return the table part
             self.object_list = self.get_queryset()
             context = self.get_context_data()
-            html = render_to_string('promapp/partials/likert_scale_response_option_translation_list_table.html', context)
-            return HttpResponse(html)
+            return TemplateResponse(request, 'promapp/partials/likert_scale_response_option_translation_list_table.html', context)
         
         # Otherwise, return the full page as usual
         return super().get(request, *args, **kwargs)
 
-class RangeScaleTranslationView(LoginRequiredMixin, PermissionRequiredMixin, UpdateView):
+class RangeScaleTranslationView(LoginRequiredMixin, PermissionRequiredMixin, _TranslationObjectMixin, UpdateView):
     """
     View for managing translations of a RangeScale.
     """
@@ -3418,8 +3676,6 @@ class RangeScaleTranslationView(LoginRequiredMixin, PermissionRequiredMixin, Upd
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['available_languages'] = settings.LANGUAGES
-        context['current_language'] = self.request.GET.get('language', settings.LANGUAGE_CODE)
         scale = self.get_object()
         context['original_min_value_text'] = scale.min_value_text
         context['original_max_value_text'] = scale.max_value_text
@@ -3427,10 +3683,10 @@ class RangeScaleTranslationView(LoginRequiredMixin, PermissionRequiredMixin, Upd
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
-        current_language = self.request.GET.get('language', settings.LANGUAGE_CODE)
+        current_language = self.get_translation_language()
         scale = self.get_object()
         try:
-            translation = scale.translations.get(language_code=current_language)
+            translation = self.get_translation(scale, current_language)
             kwargs['initial'] = {
                 'min_value_text': translation.min_value_text,
                 'max_value_text': translation.max_value_text
@@ -3443,19 +3699,19 @@ class RangeScaleTranslationView(LoginRequiredMixin, PermissionRequiredMixin, Upd
         return kwargs
 
     def form_valid(self, form):
-        current_language = self.request.GET.get('language', settings.LANGUAGE_CODE)
+        current_language = self.get_translation_language()
         scale = self.get_object()
         scale.set_current_language(current_language)
         scale.min_value_text = form.cleaned_data['min_value_text']
         scale.max_value_text = form.cleaned_data['max_value_text']
-        scale.save()
+        self.save_translation(scale)
         messages.success(self.request, _('Translation saved successfully.'))
         return redirect(self.get_success_url())
 
     def get_success_url(self):
         return reverse('range_scale_list')
 
-class RangeScaleTranslationListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
+class RangeScaleTranslationListView(LoginRequiredMixin, PermissionRequiredMixin, _TranslationListMixin, ListView):
     """
     View for listing range scales with translation links.
     """
@@ -3463,109 +3719,73 @@ class RangeScaleTranslationListView(LoginRequiredMixin, PermissionRequiredMixin,
     template_name = 'promapp/range_scale_translation_list.html'
     context_object_name = 'range_scales'
     permission_required = 'promapp.add_rangescale'
+    search_url_name = 'range_scale_translation_list'
+    paginate_by = 25
 
     def get_queryset(self):
-        queryset = RangeScale.objects.language(settings.LANGUAGE_CODE).distinct('id').order_by('id', 'translations__min_value_text')
+        # Get all range scales, sorted by their minimum value text in the default language.
+        # Translation filters use EXISTS subqueries so no DISTINCT is needed to remove duplicate rows.
+        scale_translations = RangeScale._parler_meta.root_model.objects.filter(master=OuterRef('pk'))
+        queryset = RangeScale.objects.language(settings.LANGUAGE_CODE).annotate(
+            display_name=Subquery(
+                scale_translations.filter(language_code=settings.LANGUAGE_CODE).values('min_value_text')[:1]
+            )
+        )
         
-        # Apply search filter if provided
-        search = self.request.GET.get('search')
+        # Apply search filter if provided (blank searches are skipped)
+        search = self.request.GET.get('search', '').strip()
         if search:
             queryset = queryset.filter(
-                models.Q(translations__min_value_text__icontains=search) |
-                models.Q(translations__max_value_text__icontains=search)
+                Exists(scale_translations.filter(
+                    Q(min_value_text__icontains=search) | Q(max_value_text__icontains=search)
+                ))
             )
         
         # Apply language filter if provided
         language_filter = self.request.GET.get('language_filter')
         if language_filter:
+            has_content = (
+                (Q(min_value_text__isnull=False) & ~Q(min_value_text='')) |
+                (Q(max_value_text__isnull=False) & ~Q(max_value_text=''))
+            )
             if language_filter.endswith('_translated'):
-                # Filter for range scales that have translation in the specified language
+                # Filter for range scales that have translation with content in the specified language
                 lang_code = language_filter.replace('_translated', '')
-                queryset = RangeScale.objects.filter(
-                    translations__language_code=lang_code
-                ).annotate(
-                    has_content=models.Case(
-                        models.When(
-                            models.Q(translations__min_value_text__isnull=False) & 
-                            ~models.Q(translations__min_value_text='') |
-                            models.Q(translations__max_value_text__isnull=False) & 
-                            ~models.Q(translations__max_value_text=''),
-                            then=models.Value(True)
-                        ),
-                        default=models.Value(False),
-                        output_field=models.BooleanField()
-                    )
-                ).filter(has_content=True).distinct('id').order_by('id')
+                queryset = queryset.filter(
+                    Exists(scale_translations.filter(has_content, language_code=lang_code))
+                )
             elif language_filter.endswith('_untranslated'):
-                # Filter for range scales that don't have translation in the specified language
+                # Filter for range scales that either don't have translation or have empty translation
                 lang_code = language_filter.replace('_untranslated', '')
-                # Get range scales that have meaningful translation content
-                translated_min_ids = RangeScale.objects.filter(
-                    translations__language_code=lang_code,
-                    translations__min_value_text__isnull=False,
-                ).exclude(
-                    translations__min_value_text=''
-                ).values_list('id', flat=True)
-                
-                translated_max_ids = RangeScale.objects.filter(
-                    translations__language_code=lang_code,
-                    translations__max_value_text__isnull=False,
-                ).exclude(
-                    translations__max_value_text=''
-                ).values_list('id', flat=True)
-                
-                # Combine both lists to get all translated range scales
-                all_translated_ids = set(list(translated_min_ids) + list(translated_max_ids))
-                
-                queryset = RangeScale.objects.exclude(
-                    id__in=all_translated_ids
-                ).distinct('id').order_by('id')
+                queryset = queryset.exclude(
+                    Exists(scale_translations.filter(has_content, language_code=lang_code))
+                )
             
-        return queryset
+        # Prefetch translations for the per-language status column
+        return queryset.prefetch_related('translations').order_by('display_name', 'id')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['available_languages'] = settings.LANGUAGES
-        context['current_language'] = self.request.GET.get('language', settings.LANGUAGE_CODE)
-        
-        # Create form with current values
-        form_initial = {
-            'search': self.request.GET.get('search', ''),
-            'language_filter': self.request.GET.get('language_filter', '')
-        }
-        context['search_form'] = TranslationSearchForm(initial=form_initial)
-        
-        # Set up HTMX attributes for both fields
-        context['search_form'].fields['search'].widget.attrs['hx-get'] = reverse('range_scale_translation_list')
-        context['search_form'].fields['language_filter'].widget.attrs['hx-get'] = reverse('range_scale_translation_list')
-        
-        # Add current filter values for form state preservation
-        context['current_search'] = self.request.GET.get('search', '')
-        context['current_language_filter'] = self.request.GET.get('language_filter', '')
-        
-        context['is_htmx'] = bool(self.request.META.get('HTTP_HX_REQUEST'))
         
         # Add translation status data for each range scale
         range_scales_with_translation_status = []
         for scale in context['range_scales']:
             # Get all existing translations for this scale
-            existing_translations = set(
-                scale.translations.values_list('language_code', flat=True)
-            )
+            existing_translations = {
+                scale_translation.language_code: scale_translation
+                for scale_translation in scale.translations.all()
+            }
             
             translation_status = []
             for lang_code, lang_name in settings.LANGUAGES:
                 has_translation = lang_code in existing_translations
                 # Check if translation has content (not just empty strings)
                 if has_translation:
-                    try:
-                        translation = scale.translations.get(language_code=lang_code)
-                        has_content = bool(
-                            (translation.min_value_text and translation.min_value_text.strip()) or 
-                            (translation.max_value_text and translation.max_value_text.strip())
-                        )
-                    except scale.translations.model.DoesNotExist:
-                        has_content = False
+                    translation = existing_translations[lang_code]
+                    has_content = bool(
+                        (translation.min_value_text and translation.min_value_text.strip()) or 
+                        (translation.max_value_text and translation.max_value_text.strip())
+                    )
                 else:
                     has_content = False
                     
@@ -3586,12 +3806,11 @@ class RangeScaleTranslationListView(LoginRequiredMixin, PermissionRequiredMixin,
 
     def get(self, request, *args, **kwargs):
         # Check if this is an HTMX request
-        if request.META.get('HTTP_HX_REQUEST'):
+        if request.htmx:
             # If it is an HTMX request, only return the table part
             self.object_list = self.get_queryset()
             context = self.get_context_data()
-            html = render_to_string('promapp/partials/range_scale_translation_list_table.html', context)
-            return HttpResponse(html)
+            return TemplateResponse(request, 'promapp/partials/range_scale_translation_list_table.html', context)
         
         # Otherwise, return the full page as usual
         return super().get(request, *args, **kwargs)
@@ -3601,17 +3820,17 @@ def switch_language(request):
     View to switch the current language for translation.
     """
     language = request.GET.get('language')
-    if language and language in [lang[0] for lang in settings.LANGUAGES]:
+    if language and language in _VALID_LANGUAGE_CODES:
         # Validate the next URL to prevent open redirect attacks
         next_url = request.GET.get('next', '/')
         if not url_has_allowed_host_and_scheme(next_url, allowed_hosts=None, require_https=request.is_secure()):
             next_url = '/'  # Fallback to safe default
         
-        if '?' in next_url:
-            next_url += '&language=' + language
-        else:
-            next_url += '?language=' + language
-        return redirect(next_url)
+        # Set the language parameter on the next URL, replacing any existing one
+        parts = urlsplit(next_url)
+        query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != 'language']
+        query.append(('language', language))
+        return redirect(urlunsplit(parts._replace(query=urlencode(query))))
     
     # Validate the next URL for the fallback redirect as well
     next_url = request.GET.get('next', '/')
@@ -3619,19 +3838,13 @@ def switch_language(request):
         next_url = '/'  # Fallback to safe default
     return redirect(next_url)
 
-class TranslationsDashboardView(LoginRequiredMixin, PermissionRequiredMixin, TemplateView):
+class TranslationsDashboardView(LoginRequiredMixin, PermissionRequiredMixin, _TranslationContextMixin, TemplateView):
     """
     View for the translations dashboard.
     """
     template_name = 'promapp/translations_dashboard.html'
     permission_required = 'promapp.add_questionnaire'
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['available_languages'] = settings.LANGUAGES
-        context['current_language'] = self.request.GET.get('language', settings.LANGUAGE_CODE)
-        return context
-
 def search_construct_scales(request):
     """Search construct scales and return matching results as JSON."""
     search_query = request.GET.get('q', '')
@@ -3640,20 +3853,21 @@ def search_construct_scales(request):
     # If a specific ID is requested, return that scale
     if scale_id:
         try:
-            scale = ConstructScale.objects.get(id=scale_id)
-            return JsonResponse({'results': [{'id': scale.id, 'text': scale.name}]})
-        except ConstructScale.DoesNotExist:
+            scales = ConstructScale.objects.filter(id=scale_id).values('id', text=F('name'))
+            return JsonResponse({'results': list(scales)})
+        except ValidationError:
+            # Malformed UUID
             return JsonResponse({'results': []})
     
     # Otherwise, search by query
     if not search_query:
         return JsonResponse({'results': []})
     
-    scales = ConstructScale.objects.filter(name__icontains=search_query).order_by('name')[:10]
-    results = [{'id': scale.id, 'text': scale.name} for scale in scales]
-    return JsonResponse({'results': results})
+    # Plain dicts straight from the database, no model instances needed
+    scales = ConstructScale.objects.filter(name__icontains=search_query).order_by('name').values('id', text=F('name'))[:10]
+    return JsonResponse({'results': list(scales)})
 
-class ConstructEquationView(LoginRequiredMixin, PermissionRequiredMixin, UpdateView):
+class ConstructEquationView(LoginRequiredMixin, PermissionRequiredMixin, _CachedObjectMixin, UpdateView):
     """
     View for managing the equation of a construct scale.
     """
@@ -3666,15 +3880,16 @@ class ConstructEquationView(LoginRequiredMixin, PermissionRequiredMixin, UpdateV
         context = super().get_context_data(**kwargs)
         construct_scale = self.get_object()
         
-        # Get all items associated with this construct scale
-        items = Item.objects.filter(construct_scale=construct_scale).order_by('id')
-        
-        # Get valid items with their generated question numbers
-        valid_items_with_numbers = construct_scale.get_valid_items_with_numbers()
+        # Get all items associated with this construct scale in one query, with only the
+        # columns the template and the numbering need, and split them into valid and invalid items
+        items = list(construct_scale.item_set.only(
+            'id', 'response_type', 'item_number', 'created_date'
+        ).prefetch_related('translations'))
         
-        # Separate valid and invalid items
+        valid_items_with_numbers = construct_scale.get_valid_items_with_numbers(items)
         valid_items = [item_data['item'] for item_data in valid_items_with_numbers]
-        invalid_items = [item for item in items if item.response_type not in ['Number', 'Likert', 'Range']]
+        valid_item_ids = {item.id for item in valid_items}
+        invalid_items = [item for item in items if item.id not in valid_item_ids]
         
         # Add question numbers to the context for the template
         context['valid_items_with_numbers'] = valid_items_with_numbers
@@ -3754,6 +3969,9 @@ class ConstructScaleDeleteView(LoginRequiredMixin, PermissionRequiredMixin, Dele
         messages.success(self.request, _('Construct scale deleted successfully.'))
         return super().delete(request, *args, **kwargs)
 
+# Runs of whitespace (including line breaks) in equations typed into the editor
+_WHITESPACE_RE = re.compile(r'\s+')
+
 def validate_equation(request):
     """
     HTMX endpoint to validate an equation in real-time.
@@ -3761,16 +3979,32 @@ def validate_equation(request):
     equation = request.GET.get('value', '')
     scale_id = request.GET.get('scale_id')
     
+    # Normalize line endings and whitespace
+    equation = _WHITESPACE_RE.sub(' ', equation).strip()
+    
+    # Results are cached briefly per scale, equation and language, so retyping or
+    # undoing an edit does not validate the same equation again. The scale list cache
+    # version rotates whenever a scale, an item or a scale's item set changes, so the
+    # verdict is recomputed as soon as the items it was checked against change.
+    cache_key = 'validate-equation:' + hashlib.blake2b(
+        f'{get_scale_list_cache_version()}|{scale_id}|{get_language()}|{equation}'.encode(), digest_size=16
+    ).hexdigest()
+    feedback = cache.get(cache_key)
+    if feedback is None:
+        feedback = _validate_equation_html(equation, scale_id)
+        cache.set(cache_key, feedback, 60)
+    return HttpResponse(feedback)
+
+def _validate_equation_html(equation, scale_id):
+    """Validate a normalized equation and return the feedback HTML for validate_equation."""
     try:
-        # Normalize line endings and whitespace
-        equation = equation.replace('\r\n', ' ').replace('\n', ' ').replace('\r', ' ')
-        equation = ' '.join(equation.split())  # Normalize whitespace
-        
         # If we have a scale_id, use the actual scale for validation
         # Otherwise create a temporary one (which won't have items to validate against)
         if scale_id:
             try:
-                actual_scale = ConstructScale.objects.get(id=scale_id)
+                actual_scale = ConstructScale.objects.only(
+                    'id', 'scale_equation', 'minimum_number_of_items'
+                ).get(id=scale_id)
                 # Temporarily set the equation on the actual scale for validation
                 # Save the original equation to restore it after validation
                 original_equation = actual_scale.scale_equation
@@ -3786,17 +4020,17 @@ def validate_equation(request):
             # No scale_id provided, create temporary scale for basic validation
             temp_scale = ConstructScale(scale_equation=equation)
             temp_scale.validate_scale_equation()
-        return HttpResponse('<div class="text-green-600">✓ Valid equation</div>')
+        return '<div class="text-green-600">✓ Valid equation</div>'
     except ValidationError as e:
         # Log the detailed error for debugging but return sanitized message
         logger = logging.getLogger("promapp.equations")
         logger.error(f"Equation validation error for equation '{equation}': {str(e)}")
-        return HttpResponse(f'<div class="text-red-600">✗ {escape(str(e))}</div>')
+        return f'<div class="text-red-600">✗ {escape(str(e))}</div>'
     except Exception as e:
         # Log unexpected errors but return generic message
         logger = logging.getLogger("promapp.equations")
         logger.error(f"Unexpected error validating equation '{equation}': {str(e)}")
-        return HttpResponse('<div class="text-red-600">✗ Invalid equation format</div>')
+        return '<div class="text-red-600">✗ Invalid equation format</div>'
 
 def add_to_equation(request):
     """
@@ -3851,7 +4085,7 @@ class CompositeConstructScaleScoringListView(LoginRequiredMixin, PermissionRequi
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['search_query'] = self.request.GET.get('search', '')
-        context['is_htmx'] = bool(self.request.META.get('HTTP_HX_REQUEST'))
+        context['is_htmx'] = bool(self.request.htmx)
         
         # Get scoring type choices for filter
         from .models import ScoringTypeChoices
@@ -3885,7 +4119,7 @@ class CompositeConstructScaleScoringListView(LoginRequiredMixin, PermissionRequi
     
     def get(self, request, *args, **kwargs):
         # Check if this is an HTMX request
-        if request.META.get('HTTP_HX_REQUEST'):
+        if request.htmx:
             # For HTMX requests, let Django handle pagination normally
             # but just return the partial template
             response = super().get(request, *args, **kwargs)